@@ -6,6 +6,7 @@ Confluence API 客戶端
 from __future__ import annotations
 
 import random
+import re
 import time
 from typing import Dict, List, Optional, Tuple, Any
 
@@ -16,6 +17,10 @@ from requests.auth import HTTPBasicAuth
 from utils import SyncLogger
 
 
+# 版本歷史標題（供 BeautifulSoup 比對 h2 文字）
+_HISTORY_TITLE_RE = re.compile('版本更新說明')
+
+
 class ConfluenceClient:
     """Confluence API 客戶端"""
 
@@ -381,7 +386,7 @@ class ConfluenceClient:
         history: List[Dict[str, str]] = []
         soup = BeautifulSoup(xhtml, 'html.parser')
 
-        h2_node = soup.find('h2', string=lambda s: s and '版本更新說明' in s)
+        h2_node = soup.find('h2', string=_HISTORY_TITLE_RE)
 
         if h2_node:
             table = h2_node.find_next('table')
@@ -1,20 +1,58 @@
 """
 哈希計算器
-提供檔案內容的 MD5 哈希計算，用於精確比對
+提供檔案內容的哈希計算（BLAKE3，未安裝時退回 MD5），用於精確比對
 """
 
+import os
 import hashlib
 from typing import Union
 from io import BytesIO
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+# 讀檔時每次餵給 hash 的區塊大小（file_digest 不可用時的退路）
+_CHUNK_SIZE = 1 << 20
+
+# 輸出長度固定 16 bytes（32 位十六進位），與既有 MD5 快取格式一致
+_DIGEST_BYTES = 16
+
+
+def _resolve_algorithm() -> str:
+    """
+    環境變數 HASH_ALGO 可指定 md5 / blake3（遷移期間切回 md5 用）；
+    未指定時有安裝 blake3 就用 blake3
+    """
+    algo = os.getenv('HASH_ALGO', '').strip().lower()
+    if algo == 'md5':
+        return 'md5'
+    if algo not in ('', 'blake3'):
+        raise ValueError(f"不支援的 HASH_ALGO: {algo}（僅支援 md5, blake3）")
+    if blake3 is None:
+        if algo == 'blake3':
+            raise ImportError("HASH_ALGO=blake3 但未安裝 blake3 套件")
+        return 'md5'
+    return 'blake3'
+
+
+def _new_md5():
+    # 只用於內容比對、非安全用途；FIPS 環境下也能使用
+    return hashlib.md5(usedforsecurity=False)
+
 
 class HashCalculator:
     """檔案哈希計算器"""
+
+    # 目前使用的演算法名稱，寫入遠端狀態快取供比對
+    ALGORITHM: str = _resolve_algorithm()
     
     @staticmethod
     def calculate(file_source: Union[str, bytes, BytesIO]) -> str:
         """
-        計算檔案的 MD5 哈希值
+        計算檔案的內容哈希值（演算法見 HashCalculator.ALGORITHM）
         
         Args:
             file_source: 可以是：
@@ -23,7 +61,7 @@ class HashCalculator:
                 - BytesIO 物件
         
         Returns:
-            32 位十六進位 MD5 哈希字串
+            32 位十六進位哈希字串
         
         Raises:
             Exception: 計算失敗
@@ -39,28 +77,56 @@ class HashCalculator:
             hash3 = HashCalculator.calculate(BytesIO(b'data'))
         """
         try:
+            if HashCalculator.ALGORITHM == 'blake3':
+                return HashCalculator._calculate_blake3(file_source)
+
             if isinstance(file_source, str):
-                # 讀取本地檔案
+                # 讀取本地檔案：分塊串流計算，不把整個檔案讀進記憶體
                 with open(file_source, 'rb') as f:
-                    data = f.read()
+                    if hasattr(hashlib, 'file_digest'):   # Python 3.11+
+                        return hashlib.file_digest(f, _new_md5).hexdigest()
+                    h = _new_md5()
+                    for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                        h.update(chunk)
+                    return h.hexdigest()
             elif isinstance(file_source, bytes):
                 # 直接使用二進位數據
-                data = file_source
+                h = _new_md5()
+                h.update(file_source)
             elif isinstance(file_source, BytesIO):
-                # 從 BytesIO 讀取
-                data = file_source.getvalue()
+                # 直接對內部緩衝區計算（零複製，與讀取位置無關）
+                h = _new_md5()
+                with file_source.getbuffer() as view:
+                    h.update(view)
             else:
                 raise TypeError(
                     f"不支援的類型: {type(file_source)}，"
                     f"僅支援 str, bytes, BytesIO"
                 )
             
-            # 計算 MD5
-            return hashlib.md5(data).hexdigest()
+            return h.hexdigest()
             
         except Exception as e:
             raise RuntimeError(f"哈希計算失敗: {e}") from e
     
+    @staticmethod
+    def _calculate_blake3(file_source: Union[str, bytes, BytesIO]) -> str:
+        h = blake3.blake3()
+        if isinstance(file_source, str):
+            # mmap 讀檔，交由 blake3 內部以 SIMD 處理
+            h.update_mmap(file_source)
+        elif isinstance(file_source, bytes):
+            h.update(file_source)
+        elif isinstance(file_source, BytesIO):
+            with file_source.getbuffer() as view:
+                h.update(view)
+        else:
+            raise TypeError(
+                f"不支援的類型: {type(file_source)}，"
+                f"僅支援 str, bytes, BytesIO"
+            )
+        return h.hexdigest(length=_DIGEST_BYTES)
+
     @staticmethod
     def compare(hash1: str, hash2: str) -> bool:
         """
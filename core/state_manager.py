@@ -90,11 +90,24 @@ class StateManager:
         self._remote_state = state
         self.save()
 
-    def update_remote_file(self, filename: str, attachment_id: str, file_hash: str) -> None:
+    def update_remote_file(
+        self, filename: str, attachment_id: str, file_hash: str, algo: str
+    ) -> None:
         """
         更新/新增單一遠端檔案狀態（sync_engine 依賴）
+        algo 必須明確傳入實際計算 file_hash 的演算法，避免標記錯誤觸發完整重同步
         """
-        self._remote_state[filename] = {"id": attachment_id, "hash": file_hash}
+        self._remote_state[filename] = {"id": attachment_id, "hash": file_hash, "algo": algo}
+
+    def hash_algorithm_mismatch(self, algo: str) -> bool:
+        """
+        快取中是否有以其他演算法計算的哈希（舊快取未記錄 algo 者視為 md5）。
+        成立時快取不可直接比對，需重新做完整雲端同步。
+        """
+        return any(
+            entry.get("algo", "md5") != algo
+            for entry in self._remote_state.values()
+        )
 
     def remove_remote_file(self, filename: str) -> None:
         """
@@ -129,9 +129,18 @@ class BaseSyncEngine(ABC):
         """
         try:
             # 1. 取得遠端狀態
-            if is_startup or not self.state.cache_file.exists():
+            algo_mismatch = self.state.hash_algorithm_mismatch(HashCalculator.ALGORITHM)
+            if is_startup or not self.state.cache_file.exists() or algo_mismatch:
                 self.logger.info(LogIcons.CONNECT, "執行完整雲端同步...")
                 remote_state = self._full_cloud_sync()
+                if algo_mismatch:
+                    # 切換哈希演算法：以重新校驗的結果整份取代快取並立即存檔，
+                    # 未變更的檔案也帶上新 algo，下一輪即回到增量同步
+                    self.state.remote_state = {
+                        name: {'id': data['id'], 'hash': data['hash'], 'algo': data['algo']}
+                        for name, data in remote_state.items()
+                    }
+                    remote_state = self.state.remote_state
             else:
                 remote_state = self.state.remote_state
 
@@ -321,7 +330,6 @@ class BaseSyncEngine(ABC):
         attachment: Dict[str, Any]
     ) -> Tuple[str, Dict[str, Any]]:
         """下載並計算哈希（並發任務單元）"""
-        from io import BytesIO
         import time
 
         filename = attachment.get('title', '<unknown>')
@@ -334,7 +342,7 @@ class BaseSyncEngine(ABC):
                 raise KeyError("attachment missing _links.download")
 
             content = self.client.download_attachment(download_path)
-            file_hash = HashCalculator.calculate(BytesIO(content))
+            file_hash = HashCalculator.calculate(content)
 
             elapsed_ms = (time.perf_counter() - t0) * 1000.0
             size = len(content)
@@ -342,6 +350,7 @@ class BaseSyncEngine(ABC):
             return filename, {
                 'id': attachment.get('id'),
                 'hash': file_hash,
+                'algo': HashCalculator.ALGORITHM,
                 'size': size,
                 'elapsed_ms': elapsed_ms,
             }
@@ -514,7 +523,8 @@ class BaseSyncEngine(ABC):
                         self.state.update_remote_file(
                             filename,
                             new_id,
-                            local_state[filename]['hash']
+                            local_state[filename]['hash'],
+                            HashCalculator.ALGORITHM,
                         )
                         
                         # 記錄日誌
@@ -8,7 +8,7 @@ import time
 import argparse
 import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from utils import ConfigLoader, SyncLogger, LogIcons
@@ -102,6 +102,10 @@ class ProjectInstance:
     
     def start_monitoring(self) -> None:
         """啟動檔案監聽"""
+        # 重新啟動監聽時允許事件再次啟動 debounce worker
+        self._init_dirty_state()
+        self._debounce_closed = False
+
         file_patterns = self.config.get('file_patterns', {}).get(
             'include', ['*.png', '*.jpg', '*.jpeg']
         )
@@ -125,7 +129,7 @@ class ProjectInstance:
         self.logger.info(LogIcons.WATCH, f"[{self.project_id}] 監控已啟動{suffix}")
     
     def stop_monitoring(self) -> None:
-        """停止檔案監聽（含 dirty timer 的安全收尾）"""
+        """停止檔案監聽（含 dirty debounce worker 的安全收尾）"""
         # 1) 停止 watchdog observer
         if self.monitor:
             try:
@@ -141,116 +145,156 @@ class ProjectInstance:
                     exc_info=e
                 )
 
-        # 2) 取消 dirty 合併 / retry timer（避免 stop 後又觸發 sync）
-        if hasattr(self, "_dirty_timer") and self._dirty_timer:
-            try:
-                self._dirty_timer.cancel()
-            except Exception:
-                pass
-            self._dirty_timer = None
+        # 2) 通知 debounce worker 結束（避免 stop 後又觸發 sync），之後的事件不再啟動新 worker
+        if hasattr(self, "_dirty_lock"):
+            with self._dirty_lock:
+                self._debounce_closed = True
+                stop, self._debounce_stop = self._debounce_stop, None
+            if stop is not None:
+                stop.set()          # worker 正在等截止時間時立即返回
+                self._wake.set()    # worker 正在等事件時喚醒它檢查 stop
 
         # 3) 清除 dirty 狀態（純保險，避免殘留）
         if hasattr(self, "_dirty"):
             self._dirty = False
-    
+
+    # ── dirty + 合併觸發 ──────────────────────────────────────
+    # 單一常駐 daemon worker 負責合併事件：事件只更新 flag 與截止時間，
+    # worker 等到截止時間（期間新事件會往後延）才執行一次同步
+
+    MERGE_WINDOW_S = 1.2
+    RETRY_S = 1.0
+
+    def _init_dirty_state(self) -> None:
+        """lazy init（測試會繞過 __init__，故不放在建構子）"""
+        if hasattr(self, "_dirty_lock"):
+            return
+        self._dirty = False
+        self._notes_dirty = False
+        self._dirty_deadline = 0.0
+        self._wake = threading.Event()
+        # 目前 worker 專屬的停止事件（None = 沒有 worker）；每個 worker 各自一個，
+        # 舊 worker 不會因為新 worker 啟動而被「復活」
+        self._debounce_stop: Optional[threading.Event] = None
+        self._debounce_closed = False   # stop_monitoring 後為 True，不再啟動 worker
+        self._dirty_lock = threading.Lock()
+
     def _on_file_change(self, notes_dirty: bool = False) -> None:
         """
         Dirty + 合併觸發：
-        - 圖片或 xlsx 事件進來只標記 dirty / notes_dirty
-        - 用 Timer 合併一波事件（避免連續觸發）
+        - 圖片或 xlsx 事件進來只標記 dirty / notes_dirty，並延後截止時間
+        - 由單一 worker 合併一波事件（避免連續觸發、避免每個事件開 thread）
         - 若同步中拿不到 lock，延後重試
         - 同步期間又有事件，結束後自動補跑下一輪
         - notes_dirty 只升不降：圖片事件不會清掉已標記的 notes_dirty
         """
-        import threading
-        import time
+        self._init_dirty_state()
 
-        # ---- lazy init ----
-        if not hasattr(self, "_dirty"):
-            self._dirty = False
-        if not hasattr(self, "_notes_dirty"):
-            self._notes_dirty = False
-        if not hasattr(self, "_dirty_lock"):
-            self._dirty_lock = threading.Lock()
-        if not hasattr(self, "_dirty_timer"):
-            self._dirty_timer = None
+        # ---- 事件進來：標記 dirty，notes_dirty 只升不降 ----
+        with self._dirty_lock:
+            self._dirty = True
+            if notes_dirty:
+                self._notes_dirty = True
+            self._dirty_deadline = time.monotonic() + self.MERGE_WINDOW_S
+
+            if self._debounce_stop is None and not self._debounce_closed:
+                self._debounce_stop = self._start_debounce_worker()
+
+        self._wake.set()
+
+    def _start_debounce_worker(self) -> threading.Event:
+        """啟動 worker，回傳它專屬的停止事件"""
+        stop = threading.Event()
+        threading.Thread(
+            target=self._debounce_loop,
+            args=(stop,),
+            name=f"debounce-{self.project_id}",
+            daemon=True,
+        ).start()
+        return stop
+
+    def _schedule_drain(self, delay_s: float) -> None:
+        """delay_s 秒後由 worker 再執行一次 drain"""
+        with self._dirty_lock:
+            self._dirty_deadline = time.monotonic() + delay_s
+        self._wake.set()
 
-        MERGE_WINDOW_S = 1.2
-        RETRY_S = 1.0
+    def _debounce_loop(self, stop: threading.Event) -> None:
+        while True:
+            self._wake.wait()
+            if stop.is_set():
+                return
+            self._debounce_tick(stop)
 
-        def _arm_timer(delay_s: float) -> None:
+    def _debounce_tick(self, stop: threading.Event) -> None:
+        """等到截止時間（期間可能被新事件往後延），再執行一次 drain"""
+        while True:
             with self._dirty_lock:
-                if self._dirty_timer:
-                    try:
-                        self._dirty_timer.cancel()
-                    except Exception:
-                        pass
-                    self._dirty_timer = None
-                t = threading.Timer(delay_s, _drain_dirty)
-                t.daemon = True
-                self._dirty_timer = t
-                t.start()
-
-        def _drain_dirty() -> None:
-            with self._dirty_lock:
-                if not self._dirty:
-                    return
-
-            if not self.sync_lock.acquire(blocking=False):
-                self.logger.info(
-                    LogIcons.NOTE,
-                    f"[{self.project_id}] 正在同步中，已標記 dirty，{RETRY_S:.1f}s 後重試"
-                )
-                _arm_timer(RETRY_S)
+                remaining = self._dirty_deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # 以停止事件代替 sleep：stop_monitoring 時立即結束等待
+            if stop.wait(remaining):
                 return
+        if stop.is_set():
+            return
 
-            try:
-                # 讀走兩個 flag，同時清零
-                with self._dirty_lock:
-                    self._dirty = False
-                    current_notes_dirty = self._notes_dirty
-                    self._notes_dirty = False
+        # 先清 wake 再 drain：drain 期間進來的事件會重新 set，不會遺失
+        self._wake.clear()
+        self._drain_dirty()
 
-                self.logger.info(
-                    LogIcons.PROGRESS,
-                    f"[{self.project_id}] (dirty) 合併後開始同步..."
-                )
-                self.engine.run_sync(
-                    is_startup=False,
-                    log_reason="Watcher Sync (dirty)",
-                    notes_dirty=current_notes_dirty,
-                )
+    def _drain_dirty(self) -> None:
+        with self._dirty_lock:
+            if not self._dirty:
+                return
 
-            except Exception as e:
-                self.logger.error(
-                    LogIcons.ERROR,
-                    f"[{self.project_id}] 同步失敗: {e}",
-                    exc_info=e
-                )
-                with self._dirty_lock:
-                    self._dirty = True
-                _arm_timer(RETRY_S)
+        if not self.sync_lock.acquire(blocking=False):
+            self.logger.info(
+                LogIcons.NOTE,
+                f"[{self.project_id}] 正在同步中，已標記 dirty，{self.RETRY_S:.1f}s 後重試"
+            )
+            self._schedule_drain(self.RETRY_S)
+            return
 
-            finally:
-                self.sync_lock.release()
+        try:
+            # 讀走兩個 flag，同時清零
+            with self._dirty_lock:
+                self._dirty = False
+                current_notes_dirty = self._notes_dirty
+                self._notes_dirty = False
 
-                with self._dirty_lock:
-                    needs_more = self._dirty
+            self.logger.info(
+                LogIcons.PROGRESS,
+                f"[{self.project_id}] (dirty) 合併後開始同步..."
+            )
+            self.engine.run_sync(
+                is_startup=False,
+                log_reason="Watcher Sync (dirty)",
+                notes_dirty=current_notes_dirty,
+            )
 
-                if needs_more:
-                    self.logger.info(
-                        LogIcons.NOTE,
-                        f"[{self.project_id}] 同步期間偵測到新變更，準備補跑下一輪"
-                    )
-                    _arm_timer(MERGE_WINDOW_S)
+        except Exception as e:
+            self.logger.error(
+                LogIcons.ERROR,
+                f"[{self.project_id}] 同步失敗: {e}",
+                exc_info=e
+            )
+            with self._dirty_lock:
+                self._dirty = True
+            self._schedule_drain(self.RETRY_S)
 
-        # ---- 事件進來：標記 dirty，notes_dirty 只升不降 ----
-        with self._dirty_lock:
-            self._dirty = True
-            if notes_dirty:
-                self._notes_dirty = True
+        finally:
+            self.sync_lock.release()
+
+            with self._dirty_lock:
+                needs_more = self._dirty
 
-        _arm_timer(MERGE_WINDOW_S)
+            if needs_more:
+                self.logger.info(
+                    LogIcons.NOTE,
+                    f"[{self.project_id}] 同步期間偵測到新變更，準備補跑下一輪"
+                )
+                self._schedule_drain(self.MERGE_WINDOW_S)
 
 
 class MultiProjectManager:
@@ -5,7 +5,7 @@ Slot Game 專案模組
 from .sync_engine import SlotGameSyncEngine
 from .classifier import SlotGameClassifier
 from .page_builder import SlotGamePageBuilder
-from .validator import FilenameValidator, DictLoader    # ← 新增
+from .validator import FilenameValidator, DictLoader, load_dict
 
 __all__ = [
     'SlotGameSyncEngine',
@@ -13,4 +13,5 @@ __all__ = [
     'SlotGamePageBuilder',
     'FilenameValidator',    # ← 新增
     'DictLoader',           # ← 新增
+    'load_dict',
 ]
\ No newline at end of file
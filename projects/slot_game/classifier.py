@@ -7,22 +7,31 @@ Slot Game 資源分類器
 檔名格式：{sceneModule}_{type}_{name}_{visualState}[_{languageBitmapFont}]
 """
 
-from typing import Dict, Any, Tuple, Optional, List, Set
+from collections import defaultdict
+from typing import Dict, Any, Tuple, Optional, List, Set, FrozenSet
 
 
 _NU_TYPE    = 'nu'
 _EXTENSIONS = ('.png', '.jpg', '.jpeg')
+_EXT_SET    = frozenset(_EXTENSIONS)
 
 # 預設語言代碼（與 game_dict.yaml language 欄位一致）
 # validator 啟用時由 sync_engine 傳入 DictLoader.language 覆蓋，確保單一來源
-_DEFAULT_LANG_CODES: Set[str] = {
+_DEFAULT_LANG_CODES: FrozenSet[str] = frozenset({
     'cn', 'cm', 'jp', 'kr', 'th', 'id', 'vn',
     'es', 'pt', 'tr', 'mm', 'bd', 'en'
-}
+})
 
 # 預設 NU 數字/符號集合（與 game_dict.yaml bitmap_font 數字部分一致）
 # validator 啟用時由 sync_engine 傳入 DictLoader.bitmap_font 覆蓋，確保單一來源
-_DEFAULT_BITMAP_FONT_DIGITS: Set[str] = {'0','1','2','3','4','5','6','7','8','9'}
+_DEFAULT_BITMAP_FONT_DIGITS: FrozenSet[str] = frozenset({'0','1','2','3','4','5','6','7','8','9'})
+
+# sceneModule → (一般分類, NU 分類, 多國語系分類)；未列出的 scene 一律歸 main
+_MAIN_CATEGORIES: Tuple[str, str, str] = ('main', 'nu_main', 'multi_main')
+_SCENE_CATEGORIES: Dict[str, Tuple[str, str, str]] = {
+    'free':    ('free',    'nu_free',    'multi_free'),
+    'loading': ('loading', 'nu_loading', 'multi_loading'),
+}
 
 
 class SlotGameClassifier:
@@ -54,34 +63,36 @@ class SlotGameClassifier:
             scene_modules:      場景模組集合，建議從 DictLoader.scene_module 取得。
                                 三者未傳入時使用預設值。
         """
-        self._lang_codes = (
-            {c.lower() for c in lang_codes}
+        # 分類期間只做成員查詢，統一存成 frozenset
+        self._lang_codes: FrozenSet[str] = (
+            frozenset(c.lower() for c in lang_codes)
             if lang_codes is not None
             else _DEFAULT_LANG_CODES
         )
-        self._bitmap_font_digits = (
-            {str(v) for v in bitmap_font_digits}
+        self._bitmap_font_digits: FrozenSet[str] = (
+            frozenset(str(v) for v in bitmap_font_digits)
             if bitmap_font_digits is not None
             else _DEFAULT_BITMAP_FONT_DIGITS
         )
-        self._scene_modules = (
-            {s.lower() for s in scene_modules}
+        self._scene_modules: Optional[FrozenSet[str]] = (
+            frozenset(s.lower() for s in scene_modules)
             if scene_modules is not None
             else None  # None 表示不做 sceneModule 驗證（向下相容）
         )
 
     def classify(self, asset: Dict[str, Any]) -> Tuple[str, Optional[str]]:
         filename = asset['name']
-        parts    = self._parse(filename)
 
         # 1. Layout
         if 'layout' in filename.lower():
             return 'layout', None
 
+        parts = self._parse(filename)
+
         # 2. 欄位不足 → 退化為 scene 分類（classifier 不做驗證，由 validator 負責標記）
         if len(parts) < 4:
             scene = parts[0].lower() if parts else 'base'
-            return self._scene_suffix(scene), None
+            return _SCENE_CATEGORIES.get(scene, _MAIN_CATEGORIES)[0], None
 
         scene = parts[0].lower()
 
@@ -89,44 +100,50 @@ class SlotGameClassifier:
         if self._scene_modules is not None and scene not in self._scene_modules:
             return 'unknown', None  # sceneModule 完全不認識才是 unknown
 
+        plain_cat, nu_cat, multi_cat = _SCENE_CATEGORIES.get(scene, _MAIN_CATEGORIES)
+
         # 4. NU 數字組（嚴格）：type=nu 且第 5 欄在 bitmap_font
         if parts[1].lower() == _NU_TYPE:
             if len(parts) >= 5 and parts[4] in self._bitmap_font_digits:
-                group_key = '_'.join(parts[:4])
-                return f'nu_{self._scene_suffix(scene)}', group_key
+                return nu_cat, '_'.join(parts[:4])
             # type=nu 但不符合 NU 規範 → 退化為 scene 分類（由 validator 標記異常）
-            return self._scene_suffix(scene), None
+            return plain_cat, None
 
         # 5. 多國語系：第 5 欄在 language
         if len(parts) >= 5 and parts[4].lower() in self._lang_codes:
-            group_key = '_'.join(parts[:4])
-            return f'multi_{self._scene_suffix(scene)}', group_key
+            return multi_cat, '_'.join(parts[:4])
 
         # 6. 一般資源：恰好 4 欄
-        if len(parts) == 4:
-            return self._scene_suffix(scene), None
-
         # 7. 其他（5 欄但第 5 欄既不是語系也不是數字）→ 退化為一般資源（由 validator 標記）
-        return self._scene_suffix(scene), None
+        return plain_cat, None
+
+    # organize_assets 輸出的分類與容器型態（順序即輸出順序）
+    #   True  = 群組分類：{group_key: [asset, ...]}
+    #   False = 平面分類：[asset, ...]
+    _CATEGORY_TABLE: Tuple[Tuple[str, bool], ...] = (
+        ('layout',        False),
+        ('main',          False),
+        ('free',          False),
+        ('loading',       False),
+        ('multi_main',    True),
+        ('multi_free',    True),
+        ('multi_loading', True),
+        ('nu_main',       True),
+        ('nu_free',       True),
+        ('nu_loading',    True),
+        ('unknown',       False),  # 命名異常：無法歸類的檔案
+    )
 
     def organize_assets(
         self,
         files: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
-        categories = {
-            'layout':         [],
-            'main':           [],
-            'free':           [],
-            'loading':        [],
-            'multi_main':     {},
-            'multi_free':     {},
-            'multi_loading':  {},
-            'nu_main':        {},
-            'nu_free':        {},
-            'nu_loading':     {},
-            'unknown':        [],  # 命名異常：無法歸類的檔案
+        categories: Dict[str, Any] = {
+            cat: defaultdict(list) if grouped else []
+            for cat, grouped in self._CATEGORY_TABLE
         }
 
+        classify = self.classify
         for filename, file_data in files.items():
             asset = {
                 'name':   filename,
@@ -134,29 +151,23 @@ class SlotGameClassifier:
                 'orig_w': file_data['width'],
                 'orig_h': file_data['height'],
             }
-            category, group_key = self.classify(asset)
+            category, group_key = classify(asset)
+            bucket = categories[category]
+            (bucket[group_key] if group_key else bucket).append(asset)
 
-            if group_key:
-                categories[category].setdefault(group_key, [])\
-                    if isinstance(categories[category], dict) else None
-                categories[category][group_key].append(asset)
-            else:
-                categories[category].append(asset)
+        # 轉回一般 dict，避免下游查詢不存在的群組時意外新增空群組
+        for cat, grouped in self._CATEGORY_TABLE:
+            if grouped:
+                categories[cat] = dict(categories[cat])
 
         return categories
 
     @staticmethod
     def _parse(filename: str) -> List[str]:
-        stem = filename
-        for ext in _EXTENSIONS:
-            if filename.lower().endswith(ext):
-                stem = filename[:-len(ext)]
-                break
+        # 只取最後一個 '.' 之後比對副檔名，不必對整個檔名逐一轉小寫
+        dot = filename.rfind('.')
+        if dot >= 0 and filename[dot:].lower() in _EXT_SET:
+            stem = filename[:dot]
+        else:
+            stem = filename
         return stem.split('_')
-
-    @staticmethod
-    def _scene_suffix(scene: str) -> str:
-        if scene == 'free':    return 'free'
-        if scene == 'loading': return 'loading'
-        return 'main'
-
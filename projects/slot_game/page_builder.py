@@ -33,8 +33,9 @@ def _escape_xml(text: str) -> str:
 
 
 def _stem(filename: str) -> str:
-    from pathlib import Path
-    return Path(filename).stem
+    """去掉最後一段副檔名（與 Path(filename).stem 相同，但不建立 Path 物件）"""
+    i = filename.rfind('.')
+    return filename[:i] if 0 < i < len(filename) - 1 else filename
 
 
 def _note_for(filename: str, notes: Dict[str, str]) -> str:
@@ -45,7 +46,10 @@ def _note_for(filename: str, notes: Dict[str, str]) -> str:
       - btn_start.png  -> "..."
       - btn_start      -> "..."（不含副檔名）
     """
-    return notes.get(filename, notes.get(_stem(filename), ''))
+    note = notes.get(filename)
+    if note is not None:
+        return note
+    return notes.get(_stem(filename), '')
 
 
 class SlotGamePageBuilder:
@@ -3,16 +3,27 @@ Slot Game 同步引擎
 整合分類器、頁面建構器、說明文件載入器、檔名驗證器
 """
 
+import re
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup
 
 from core import BaseSyncEngine
 from .classifier import SlotGameClassifier
 from .page_builder import SlotGamePageBuilder
-from .validator import DictLoader, FilenameValidator
+from .validator import FilenameValidator, load_dict
 from utils.note_loader import NoteLoader
 
 
+# 更新紀錄標題（供 BeautifulSoup 比對 h2 文字）
+_HISTORY_TITLE_RE = re.compile('更新紀錄')
+
+# 更新紀錄區塊：標題 h2 與緊接其後的第一個 table
+_HISTORY_SECTION_RE = re.compile(
+    r'(<h2[^>]*>[^<]*更新紀錄[^<]*</h2>\s*)<table\b[^>]*>.*?</table>',
+    re.DOTALL,
+)
+
+
 class SlotGameSyncEngine(BaseSyncEngine):
     """Slot Game 同步引擎"""
 
@@ -41,7 +52,7 @@ class SlotGameSyncEngine(BaseSyncEngine):
                 self.logger.warning("⚠️", "validator.enabled=true 但未設定 dict_file，驗證器停用")
             else:
                 try:
-                    loader         = DictLoader(dict_file)
+                    loader         = load_dict(dict_file)
                     self.validator = FilenameValidator(loader)
                     # 讓 classifier 使用與 validator 相同的語系集合，避免兩邊不同步
                     self.classifier = SlotGameClassifier(
@@ -85,13 +96,27 @@ class SlotGameSyncEngine(BaseSyncEngine):
         )
 
     def _update_history_only(self, current_xhtml: str) -> str:
+        new_history_table = self.page_builder._generate_history_table(
+            self.state.get_history_slice(self.history_keep)
+        )
+
+        # 快速路徑：直接以字串替換舊 table，不必解析、重新序列化整頁
+        # （_generate_history_table 輸出含 h2，只取 table 部分；標題沿用頁面原有的）
+        table_start = new_history_table.find('<table')
+        if table_start >= 0:
+            m = _HISTORY_SECTION_RE.search(current_xhtml)
+            if m:
+                return (
+                    current_xhtml[:m.start()]
+                    + m.group(1)
+                    + new_history_table[table_start:]
+                    + current_xhtml[m.end():]
+                )
+
         soup    = BeautifulSoup(current_xhtml, 'html.parser')
-        h2_node = soup.find('h2', string=lambda s: s and '更新紀錄' in s)
+        h2_node = soup.find('h2', string=_HISTORY_TITLE_RE)
 
         if h2_node:
-            new_history_table = self.page_builder._generate_history_table(
-                self.state.get_history_slice(self.history_keep)
-            )
             old_table = h2_node.find_next('table')
             if old_table:
                 new_soup = BeautifulSoup(new_history_table, 'html.parser')
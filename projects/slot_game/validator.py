@@ -8,16 +8,35 @@ Slot Game 檔名驗證器
 """
 
 import re
+import functools
+import threading
 import yaml
 from pathlib import Path
-from typing import Optional, Set, List, Tuple
+from typing import Callable, Optional, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+try:
+    from yaml import CSafeLoader as _SafeLoader    # libyaml C 實作
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import hyperscan    # 選用：多模式一次掃描，未安裝時退回逐條 re
+except ImportError:
+    hyperscan = None
 
 
 _EXTENSIONS = ('.png', '.jpg', '.jpeg')
+_EXT_SET    = frozenset(_EXTENSIONS)
+
+# 全形括號 / 全形空白 → 半形，之後的比對只需處理 ASCII 字元
+_PAREN_NORMALIZE = str.maketrans({'（': '(', '）': ')', '\u3000': ' '})
+
+# 群組鍵中的括號數字：(1), (2)（全形括號已先正規化）
+_GROUP_BRACKET_NUM_RE = re.compile(r'\(\s*\d+\s*\)')
 
 
 class DictLoader:
-    """從 yaml 字典檔載入所有命名範圍資料"""
+    """從 yaml 字典檔載入所有命名範圍資料（載入後皆為不可變的 frozenset）"""
 
     def __init__(self, dict_file: str):
         path = Path(dict_file)
@@ -25,34 +44,44 @@ class DictLoader:
             raise FileNotFoundError(f"[DictLoader] 字典檔不存在：{dict_file}")
 
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
 
-        self.scene_module: Set[str] = self._load_set(data, 'scene_module')
-        self.type_:        Set[str] = self._load_set(data, 'type')
-        self.named:        Set[str] = self._load_set(data, 'named')
-        self.state:        Set[str] = self._load_set(data, 'state')
-        self.language:     Set[str] = self._load_set(data, 'language')
-        self.bitmap_font:  Set[str] = self._load_set(data, 'bitmap_font')
+        self.scene_module: FrozenSet[str] = self._load_set(data, 'scene_module')
+        self.type_:        FrozenSet[str] = self._load_set(data, 'type')
+        self.named:        FrozenSet[str] = self._load_set(data, 'named')
+        self.state:        FrozenSet[str] = self._load_set(data, 'state')
+        self.language:     FrozenSet[str] = self._load_set(data, 'language')
+        self.bitmap_font:  FrozenSet[str] = self._load_set(data, 'bitmap_font')
 
-        self.language_bitmap_font: Set[str] = self.language | self.bitmap_font
+        self.language_bitmap_font: FrozenSet[str] = self.language | self.bitmap_font
 
-        self.forbidden_words: Set[str] = {
+        self.forbidden_words: FrozenSet[str] = frozenset(
             str(w).lower()
             for w in data.get('forbidden_words', [])
             if w is not None
-        }
+        )
 
         self.empty_option: str = str(data.get('empty_option', ''))
 
         # 規則 3 比對集合（named 白名單不納入）
-        self.reserved_names: Set[str] = (
+        self.reserved_names: FrozenSet[str] = (
             self.scene_module | self.type_ | self.bitmap_font
             | self.state | self.language
         )
 
     @staticmethod
-    def _load_set(data: dict, key: str) -> Set[str]:
-        return {str(v) for v in data.get(key, []) if v is not None}
+    def _load_set(data: dict, key: str) -> FrozenSet[str]:
+        return frozenset(str(v) for v in data.get(key, []) if v is not None)
+
+
+@functools.lru_cache(maxsize=8)
+def load_dict(dict_file: str) -> DictLoader:
+    """
+    取得字典檔的共用 DictLoader（同一路徑只解析一次）。
+    DictLoader 載入後不可變，可安全地在多個專案 / 驗證器間共用；
+    字典檔更新後需呼叫 load_dict.cache_clear() 才會重新讀取。
+    """
+    return DictLoader(dict_file)
 
 
 class FilenameValidator:
@@ -63,17 +92,26 @@ class FilenameValidator:
         None  = 通過
         str   = 第一個命中的警告訊息
 
+    validate_many(filenames) → Dict[str, Optional[str]]
+        批次版 validate，供大量檔名一次驗證
+
     validate_group_key(group_key) → Optional[str]
         用於 NU / 多國語系群組標題的異常偵測
     """
 
     def __init__(self, dict_loader: DictLoader):
         self.d = dict_loader
+        # validate 只依賴檔名與字典內容，同一檔名重複驗證時直接取快取
+        self._validate_cached = functools.lru_cache(maxsize=8192)(self._validate_impl)
+        self._validate_all_cached = functools.lru_cache(maxsize=8192)(self._validate_all_impl)
 
     # ── 公開介面 ──────────────────────────────────────────────
 
     def validate(self, filename: str) -> Optional[str]:
         """驗證單一檔名"""
+        return self._validate_cached(filename)
+
+    def _validate_impl(self, filename: str) -> Optional[str]:
         # layout 不驗證（格式自由，不適用命名規範）
         if 'layout' in filename.lower():
             return None
@@ -84,30 +122,44 @@ class FilenameValidator:
             return system_warn
 
         parts = self._parse(filename)
+        # type 是否為 nu 只判定一次，欄位數量檢查與規則 5、6 共用
+        is_nu = self._is_nu(parts)
 
         # 1. 欄位數量檢查（不足時直接回傳，避免後續 index 錯誤）
-        field_warn = self._check_field_count(filename, parts)
+        field_warn = self._check_field_count(parts, is_nu)
         if field_warn:
             return field_warn
 
         # 欄位數量已確認 >= 4，安全取值
-        A = parts[0]
-        B = parts[1]
+        # E 含第 5 欄之後的所有內容（供規則 2 檢查底線）；規則 5、6 只看第 5 欄本身
         C = parts[2]
-        D = parts[3]
         E = parts[4] if len(parts) >= 5 else self.d.empty_option
+        suffix = E.partition('_')[0]
+
+        # 小寫形式只算一次，供規則 4 使用
+        C_lower = C.lower()
 
         return (
             self._rule1_name_empty(C)
-            or self._rule2_underscore(A, B, C, D, E)
+            or self._rule2_underscore(E)
             or self._rule3_name_duplicate(C)
-            or self._rule4_forbidden(C)
-            or self._rule5_nu_suffix(B, E)
-            or self._rule6_lang_suffix(B, E)
+            or self._rule4_forbidden(C_lower)
+            # 規則 5、6 以 is_nu 互斥，只需執行其中一條
+            or (self._rule5_nu_suffix(suffix) if is_nu
+                else self._rule6_lang_suffix(suffix))
         )
 
+    def validate_many(self, filenames: Iterable[str]) -> Dict[str, Optional[str]]:
+        """批次驗證，回傳 {檔名: validate() 結果}；重複檔名只驗證一次"""
+        validate = self._validate_cached
+        return {name: validate(name) for name in dict.fromkeys(filenames)}
+
     def validate_all(self, filename: str) -> List[str]:
         """回傳所有違反規則的警告列表（不在第一個命中就停）"""
+        # 快取內存 tuple，每次回傳新 list，呼叫端修改不會污染快取
+        return list(self._validate_all_cached(filename))
+
+    def _validate_all_impl(self, filename: str) -> Tuple[str, ...]:
         warnings = []
 
         # 0. 前置過濾：系統/雲端異常（獨立於語意規則）
@@ -117,32 +169,35 @@ class FilenameValidator:
 
         # layout 不驗證語意規則
         if 'layout' in filename.lower():
-            return warnings
+            return tuple(warnings)
 
         parts = self._parse(filename)
+        is_nu = self._is_nu(parts)
 
         # 1. 欄位數量（若有問題，語意規則無法執行，直接回傳）
-        field_warn = self._check_field_count(filename, parts)
+        field_warn = self._check_field_count(parts, is_nu)
         if field_warn:
             warnings.append(field_warn)
-            return warnings
+            return tuple(warnings)
 
         # 2–7. 語意規則（全部跑完，收集所有違規）
-        A, B, C, D = parts[0], parts[1], parts[2], parts[3]
+        C = parts[2]
         E = parts[4] if len(parts) >= 5 else self.d.empty_option
+        suffix = E.partition('_')[0]
+        C_lower = C.lower()
 
         for check in [
             self._rule1_name_empty(C),
-            self._rule2_underscore(A, B, C, D, E),
+            self._rule2_underscore(E),
             self._rule3_name_duplicate(C),
-            self._rule4_forbidden(C),
-            self._rule5_nu_suffix(B, E),
-            self._rule6_lang_suffix(B, E),
+            self._rule4_forbidden(C_lower),
+            (self._rule5_nu_suffix(suffix) if is_nu
+             else self._rule6_lang_suffix(suffix)),
         ]:
             if check:
                 warnings.append(check)
 
-        return warnings
+        return tuple(warnings)
 
     def validate_group_key(self, group_key: str) -> Optional[str]:
         """
@@ -150,74 +205,143 @@ class FilenameValidator:
         group_key 是由 classifier 從檔名解析出的前 4 欄，
         若原始檔名含有雲端衝突符號，group_key 也會帶入異常字元。
         """
+        # 快速路徑：只有含括號或空白（半形 / 全形）的群組鍵才可能命中；
+        # 逐字元 in 走 C 層的快速子字串搜尋，正常群組鍵直接通過
+        if not (
+            '(' in group_key or ' ' in group_key
+            or '（' in group_key or '\u3000' in group_key
+        ):
+            return None
+
+        key = group_key.translate(_PAREN_NORMALIZE)
         # 括號數字：(1), (2), （1）
-        if re.search(r'[（(]\s*\d+\s*[）)]', group_key):
+        if _GROUP_BRACKET_NUM_RE.search(key):
             return '⚠️ 組別名稱異常，疑似包含雲端同步衝突檔案'
-        # 空白字元
-        if ' ' in group_key or '\u3000' in group_key:
+        # 空白字元（全形空白已正規化為半形）
+        if ' ' in key:
             return '⚠️ 組別名稱異常，疑似包含空白字元'
         return None
 
+    def clear_cache(self) -> None:
+        """字典內容變更後呼叫，清除 validate / validate_all 快取"""
+        self._validate_cached.cache_clear()
+        self._validate_all_cached.cache_clear()
+
     # ── 前置過濾 0：系統/雲端異常檔名 ────────────────────────
 
     # 偵測規則對照表（依序比對，第一個命中即回傳）
-    _SYSTEM_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    # 比對對象為經 _PAREN_NORMALIZE 正規化後的檔名，括號只需寫半形；
+    # 第一欄為編譯好的正規表示式（以 .search 比對，並納入 Hyperscan 資料庫），
+    # 或固定字首等不需正規表示式的 str 判斷函式
+    _SYSTEM_RULES: List[Tuple[Union[re.Pattern, Callable[[str], object]], str]] = [
         # 雲端同步衝突複本
-        (re.compile(r'\s*[（(]\s*\d+\s*[）)]\s*\.', re.IGNORECASE),
+        (re.compile(r'\s*\(\s*\d+\s*\)\s*\.', re.IGNORECASE),
          '⚠️ 疑似雲端同步衝突複本（含括號數字）'),
-        (re.compile(r'\s*-\s*複製\s*\.', re.IGNORECASE),
+        (re.compile(r'\s*-\s*複製\s*\.'),
          '⚠️ 疑似手動複製檔案（含「複製」字樣）'),
         (re.compile(r'\s*-\s*Copy\s*\.', re.IGNORECASE),
          '⚠️ 疑似手動複製檔案（含「Copy」字樣）'),
-        (re.compile(r'[（(][^）)]*衝突副本[^）)]*[）)]', re.IGNORECASE),
+        (re.compile(r'\([^)]*衝突副本[^)]*\)'),
          '⚠️ 疑似 Dropbox 衝突複本'),
         # macOS / Office 暫存
-        (re.compile(r'^[._]{2}'),
+        (lambda s: s.startswith(('._', '..', '_.', '__')),
          '⚠️ 疑似 macOS 系統暫存檔（._前綴）'),
-        (re.compile(r'^~\$'),
+        (lambda s: s.startswith('~$'),
          '⚠️ 疑似 Office 暫存檔（~$前綴）'),
-        # 空白字元
-        (re.compile(r'^\s|\s(?=\.)'),
+        # 空白字元（各分支拆成獨立條目，讓 re 可走字面前綴快速掃描）
+        (lambda s: s[:1].isspace(),
+         '⚠️ 檔名含有開頭或結尾空白字元'),
+        (re.compile(r'\s\.'),
          '⚠️ 檔名含有開頭或結尾空白字元'),
-        (re.compile(r'_\s|\s_'),
+        (re.compile(r'_\s'),
+         '⚠️ 檔名欄位間含有空白字元'),
+        (re.compile(r'\s_'),
          '⚠️ 檔名欄位間含有空白字元'),
     ]
 
     @classmethod
     def _check_system_filename(cls, filename: str) -> Optional[str]:
-        for pattern, message in cls._SYSTEM_PATTERNS:
-            if pattern.search(filename):
+        # 快速預篩：每條規則都至少需要下列其中一種字元，正常檔名直接略過比對
+        #   括號 → 衝突複本；'-' → 複製 / Copy；開頭 . _ ~ → 暫存檔；
+        #   空白 → ' ' 或不可列印字元（\u3000、\t 等所有 \s 皆屬此類）
+        if not (
+            '(' in filename or '（' in filename or '-' in filename
+            or filename[:1] in ('.', '_', '~')
+            or ' ' in filename or not filename.isprintable()
+        ):
+            return None
+
+        candidate = filename.translate(_PAREN_NORMALIZE)
+        rules     = cls._SYSTEM_RULES
+        matchers  = _SYSTEM_MATCHERS
+
+        # 正規表示式規則一次掃描，收集所有命中後取對照表中最前者；
+        # 排在它之前的 str 規則再逐條補判，維持原本的優先順序
+        hits = _scan_system_db(candidate)
+        if hits is not None:
+            first = min(hits) if hits else len(rules)
+            for i in _SYSTEM_STR_RULE_IDS:
+                if i >= first:
+                    break
+                if matchers[i](candidate):
+                    first = i
+                    break
+            return rules[first][1] if first < len(rules) else None
+
+        for matches, (_, message) in zip(matchers, rules):
+            if matches(candidate):
                 return message
         return None
 
     # ── 前置檢查 1：欄位數量 ──────────────────────────────────
 
-    def _check_field_count(self, filename: str, parts: List[str]) -> Optional[str]:
-        if 'layout' in filename.lower():
-            return None
-
+    _MSG_NU_SHORT    = '⚠️ 疑似 NU 數字組檔案，欄位不足（需要 5 欄）'
+    _MSG_NU_NO_STATE = '⚠️ 疑似 NU 數字組檔案，欄位不足（缺少 visualState，數字出現在第 4 欄）'
+    _MSG_LANG_SHORT  = '⚠️ 疑似多國語系檔案，欄位不足（語系代碼位置錯誤）'
+    _MSG_LANG_IN_4   = '⚠️ 疑似多國語系檔案，欄位不足（語系代碼出現在第 4 欄，應在第 5 欄）'
+
+    # 對照表：(欄位數 n, type 是否為 nu, 特徵欄位種類) → 警告訊息（未列出 = 通過）
+    # 特徵欄位：n == 3 看第 3 欄，n >= 4 看第 4 欄
+    #   0 = 一般值、1 = bitmap_font（僅 nu 時判定）、2 = language
+    # _parse 以 maxsplit=4 切欄，n 最大為 5
+    _FIELD_COUNT_MSG: Dict[Tuple[int, bool, int], str] = {
+        (1, False, 0): '⚠️ 欄位不足（只有 1 欄，需要 4 欄）',
+        (2, False, 0): '⚠️ 欄位不足（只有 2 欄，需要 4 欄）',
+        (2, True,  0): _MSG_NU_SHORT,
+        (3, False, 0): '⚠️ 欄位不足（只有 3 欄，需要 4 欄）',
+        (3, False, 2): _MSG_LANG_SHORT,
+        (3, True,  0): _MSG_NU_SHORT,
+        (3, True,  2): _MSG_NU_SHORT,
+        (4, False, 2): _MSG_LANG_IN_4,
+        (4, True,  0): _MSG_NU_SHORT,
+        (4, True,  1): _MSG_NU_NO_STATE,
+        (4, True,  2): _MSG_LANG_IN_4,
+        (5, False, 2): _MSG_LANG_IN_4,
+        (5, True,  1): _MSG_NU_NO_STATE,
+        (5, True,  2): _MSG_LANG_IN_4,
+    }
+
+    def _check_field_count(self, parts: List[str], is_nu: bool) -> Optional[str]:
+        # layout 檔案已在 validate / validate_all 開頭排除，這裡不再重複判斷
         n = len(parts)
 
-        if n < 4:
-            if n >= 2 and parts[1].lower() == 'nu':
-                return '⚠️ 疑似 NU 數字組檔案，欄位不足（需要 5 欄）'
-            for i in range(2, min(n, 4)):
-                if parts[i] in self.d.language:
-                    return '⚠️ 疑似多國語系檔案，欄位不足（語系代碼位置錯誤）'
-            return f'⚠️ 欄位不足（只有 {n} 欄，需要 4 欄）'
-
         if n >= 4:
-            if parts[1].lower() == 'nu' and parts[3] in self.d.bitmap_font:
-                return '⚠️ 疑似 NU 數字組檔案，欄位不足（缺少 visualState，數字出現在第 4 欄）'
-            if parts[3] in self.d.language:
-                return '⚠️ 疑似多國語系檔案，欄位不足（語系代碼出現在第 4 欄，應在第 5 欄）'
-
-        if n >= 2 and parts[1].lower() == 'nu' and n < 5:
-            return '⚠️ 疑似 NU 數字組檔案，欄位不足（需要 5 欄）'
-
-        return None
+            p3 = parts[3]
+            if is_nu and p3 in self.d.bitmap_font:
+                kind = 1
+            elif p3 in self.d.language:
+                kind = 2
+            else:
+                kind = 0
+        elif n == 3:
+            kind = 2 if parts[2] in self.d.language else 0
+        else:
+            kind = 0
+
+        return self._FIELD_COUNT_MSG.get((n, is_nu, kind))
 
     # ── 語意規則 2–7 ──────────────────────────────────────────
+    # 規則 4 的 name 由呼叫端預先轉為小寫；規則 5、6 由呼叫端依 is_nu 擇一呼叫
 
     @staticmethod
     def _rule1_name_empty(name: str) -> Optional[str]:
@@ -226,10 +350,10 @@ class FilenameValidator:
         return None
 
     @staticmethod
-    def _rule2_underscore(*fields: str) -> Optional[str]:
-        for f in fields:
-            if f and '_' in f:
-                return '⚠️ 格式錯誤：各欄位內不得包含底線 [_] 符號'
+    def _rule2_underscore(e: str) -> Optional[str]:
+        # _parse 以 maxsplit=4 切欄，前 4 欄必不含底線；多出的底線全留在第 5 欄
+        if '_' in e:
+            return '⚠️ 格式錯誤：各欄位內不得包含底線 [_] 符號'
         return None
 
     def _rule3_name_duplicate(self, name: str) -> Optional[str]:
@@ -238,29 +362,99 @@ class FilenameValidator:
         return None
 
     def _rule4_forbidden(self, name: str) -> Optional[str]:
-        if name.lower() in self.d.forbidden_words:
+        if name in self.d.forbidden_words:
             return '⚠️ [命名] 包含禁詞'
         return None
 
-    def _rule5_nu_suffix(self, type_: str, e: str) -> Optional[str]:
-        if type_.lower() == 'nu':
-            if e == self.d.empty_option or e not in self.d.bitmap_font:
-                return '⚠️ [nu] 須符合數字規範，不得使用語系尾綴取名'
+    def _rule5_nu_suffix(self, e: str) -> Optional[str]:
+        """type 為 nu 的檔案：第 5 欄須為 bitmap_font"""
+        if e == self.d.empty_option or e not in self.d.bitmap_font:
+            return '⚠️ [nu] 須符合數字規範，不得使用語系尾綴取名'
         return None
 
-    def _rule6_lang_suffix(self, type_: str, e: str) -> Optional[str]:
-        if type_.lower() != 'nu':
-            if e and e != self.d.empty_option and e not in self.d.language:
-                return '⚠️ 若為多語系物件須符合規範，不得使用數字尾綴取名'
+    def _rule6_lang_suffix(self, e: str) -> Optional[str]:
+        """type 非 nu 的檔案：第 5 欄有值時須為 language"""
+        if e and e != self.d.empty_option and e not in self.d.language:
+            return '⚠️ 若為多語系物件須符合規範，不得使用數字尾綴取名'
         return None
 
     # ── 工具 ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _is_nu(parts: List[str]) -> bool:
+        return len(parts) >= 2 and parts[1].lower() == 'nu'
+
     @staticmethod
     def _parse(filename: str) -> List[str]:
-        stem = filename
-        for ext in _EXTENSIONS:
-            if filename.lower().endswith(ext):
-                stem = filename[:-len(ext)]
-                break
-        return stem.split('_')
+        dot = filename.rfind('.')
+        if dot >= 0 and filename[dot:].lower() in _EXT_SET:
+            stem = filename[:dot]
+        else:
+            stem = filename
+        # 只會用到前 5 欄；多出的底線留在第 5 欄，交由規則 2 回報
+        return stem.split('_', 4)
+
+
+def _compile_system_db(rules: List[Tuple[Union[re.Pattern, Callable[[str], object]], str]]):
+    """
+    將 _SYSTEM_RULES 中的正規表示式規則編譯為單一 Hyperscan 資料庫
+    （id 即對照表索引）。未安裝 hyperscan 或編譯失敗時回傳 None（改走逐條比對）。
+    """
+    if hyperscan is None:
+        return None
+
+    patterns = [
+        (i, rule) for i, (rule, _) in enumerate(rules)
+        if isinstance(rule, re.Pattern)
+    ]
+    base = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[p.pattern.encode('utf-8') for _, p in patterns],
+            ids=[i for i, _ in patterns],
+            flags=[
+                base | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                for _, p in patterns
+            ],
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+# 各規則的比對函式（正規表示式取 .search，其餘直接使用），索引與對照表一致
+_SYSTEM_MATCHERS: Tuple[Callable[[str], object], ...] = tuple(
+    rule.search if isinstance(rule, re.Pattern) else rule
+    for rule, _ in FilenameValidator._SYSTEM_RULES
+)
+
+_SYSTEM_DB = _compile_system_db(FilenameValidator._SYSTEM_RULES)
+
+# 不在 Hyperscan 資料庫中、需以 Python 逐條判斷的規則索引（依對照表順序）
+_SYSTEM_STR_RULE_IDS: Tuple[int, ...] = tuple(
+    i for i, (rule, _) in enumerate(FilenameValidator._SYSTEM_RULES)
+    if not isinstance(rule, re.Pattern)
+)
+
+# Hyperscan scratch 不可被同時進行的掃描共用；多專案並行驗證時每條執行緒各持一份
+_SYSTEM_SCRATCH = threading.local()
+
+
+def _scan_system_db(candidate: str) -> Optional[List[int]]:
+    """以 Hyperscan 掃描檔名，回傳命中的規則索引；未啟用或掃描失敗時回傳 None"""
+    if _SYSTEM_DB is None:
+        return None
+    hits: List[int] = []
+    try:
+        scratch = getattr(_SYSTEM_SCRATCH, 'scratch', None)
+        if scratch is None:
+            scratch = _SYSTEM_SCRATCH.scratch = hyperscan.Scratch(_SYSTEM_DB)
+        _SYSTEM_DB.scan(
+            candidate.encode('utf-8'),
+            match_event_handler=lambda i, *_: hits.append(i),
+            scratch=scratch,
+        )
+    except hyperscan.error:
+        return None    # 退回逐條 re 比對
+    return hits
@@ -0,0 +1,32 @@
+"""
+測試共用 Fixture
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from core.sync_engine import BaseSyncEngine
+from projects.slot_game.validator import FilenameValidator, load_dict
+from utils.logger import SyncLogger
+
+
+@pytest.fixture(scope='session')
+def validator():
+    """整個測試流程共用一個 validator；字典經 load_dict 只解析一次"""
+    return FilenameValidator(load_dict('config/game_dict.yaml'))
+
+
+@pytest.fixture
+def dummy_logger():
+    """只記錄呼叫的 SyncLogger 替身"""
+    return MagicMock(spec=SyncLogger)
+
+
+@pytest.fixture
+def dummy_engine():
+    """
+    只記錄呼叫的同步引擎替身：
+    以 run_sync.call_args_list / call_args.kwargs 檢查呼叫參數，
+    需要在同步途中做事時設定 run_sync.side_effect
+    """
+    return MagicMock(spec=BaseSyncEngine)
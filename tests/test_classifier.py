@@ -13,61 +13,41 @@ def _asset(name, w=100, h=100):
     return {'name': name, 'size': f'{w}x{h}', 'orig_w': w, 'orig_h': h}
 
 
+# (檔名, 預期分類, 預期 group_key)
+_CLASSIFY_CASES = [
+    # 基本分類
+    pytest.param('layout_main.png',             'layout',  None, id='layout'),
+    pytest.param('base_img_bg_normal.png',      'main',    None, id='main'),
+    pytest.param('free_img_bg_normal.png',      'free',    None, id='free'),
+    pytest.param('loading_img_logo_na.png',     'loading', None, id='loading'),
+    # 多國語系
+    pytest.param('base_btn_start_normal_cn.png', 'multi_main',    'base_btn_start_normal', id='multilang-main'),
+    pytest.param('free_text_bonus_na_en.png',    'multi_free',    'free_text_bonus_na',    id='multilang-free'),
+    pytest.param('loading_text_tip_na_jp.png',   'multi_loading', 'loading_text_tip_na',   id='multilang-loading'),
+    # NU 數字組
+    pytest.param('base_nu_win_na_0.png',  'nu_main', 'base_nu_win_na',  id='nu-main'),
+    pytest.param('free_nu_mult_na_5.png', 'nu_free', 'free_nu_mult_na', id='nu-free'),
+    # NU 退化：第 4 欄是數字（缺 visualState）、雲端衝突複本 → 一般分類，不被誤判為 NU 群組
+    pytest.param('autostart_nu_auto_4.png',      'main', None, id='nu-missing-visualstate'),
+    pytest.param('autostart_nu_auto_4 (1).png',  'main', None, id='nu-cloud-conflict'),
+    pytest.param('autostart_nu_auto_5 (1).png',  'main', None, id='nu-cloud-conflict-2'),
+    pytest.param('autostart_nu_auto_9（2）.png', 'main', None, id='nu-cloud-conflict-fullwidth'),
+    # 欄位不足（非 NU）→ 退化為 scene 分類
+    pytest.param('loading_bar.png', 'loading', None, id='insufficient-loading'),
+    pytest.param('base_img.png',    'main',    None, id='insufficient-main'),
+]
+
+
 class TestSlotGameClassifier:
 
     def setup_method(self):
         self.classifier = SlotGameClassifier()
 
-    # ── 基本分類 ──────────────────────────────────────────────
-
-    def test_layout_classification(self):
-        cat, grp = self.classifier.classify(_asset('layout_main.png'))
-        assert cat == 'layout'
-        assert grp is None
-
-    def test_main_classification(self):
-        cat, grp = self.classifier.classify(_asset('base_img_bg_normal.png'))
-        assert cat == 'main'
-        assert grp is None
-
-    def test_free_classification(self):
-        cat, grp = self.classifier.classify(_asset('free_img_bg_normal.png'))
-        assert cat == 'free'
-        assert grp is None
-
-    def test_loading_classification(self):
-        cat, grp = self.classifier.classify(_asset('loading_img_logo_na.png'))
-        assert cat == 'loading'
-        assert grp is None
-
-    # ── 多國語系 ──────────────────────────────────────────────
+    # ── 單一檔名分類（對照表見 _CLASSIFY_CASES）────────────────
 
-    def test_multilang_main_classification(self):
-        cat, grp = self.classifier.classify(_asset('base_btn_start_normal_cn.png'))
-        assert cat == 'multi_main'
-        assert grp == 'base_btn_start_normal'
-
-    def test_multilang_free_classification(self):
-        cat, grp = self.classifier.classify(_asset('free_text_bonus_na_en.png'))
-        assert cat == 'multi_free'
-        assert grp == 'free_text_bonus_na'
-
-    def test_multilang_loading_classification(self):
-        cat, grp = self.classifier.classify(_asset('loading_text_tip_na_jp.png'))
-        assert cat == 'multi_loading'
-        assert grp == 'loading_text_tip_na'
-
-    # ── NU 數字組 ─────────────────────────────────────────────
-
-    def test_nu_main_classification(self):
-        cat, grp = self.classifier.classify(_asset('base_nu_win_na_0.png'))
-        assert cat == 'nu_main'
-        assert grp == 'base_nu_win_na'
-
-    def test_nu_free_classification(self):
-        cat, grp = self.classifier.classify(_asset('free_nu_mult_na_5.png'))
-        assert cat == 'nu_free'
-        assert grp == 'free_nu_mult_na'
+    @pytest.mark.parametrize('name, expected_cat, expected_grp', _CLASSIFY_CASES)
+    def test_classify(self, name, expected_cat, expected_grp):
+        assert self.classifier.classify(_asset(name)) == (expected_cat, expected_grp)
 
     def test_nu_different_visualstate_different_group(self):
         """相同 name 不同 visualState 的 NU 應分到不同群組"""
@@ -77,39 +57,6 @@ class TestSlotGameClassifier:
         assert grp_confirm == 'base_nu_win_confirm'
         assert grp_na != grp_confirm
 
-    # ── NU 退化：欄位不足 → 一般分類 ─────────────────────────
-
-    def test_nu_missing_visualstate_degrades(self):
-        """NU 第 4 欄是數字（缺 visualState）→ 退化為一般分類"""
-        cat, grp = self.classifier.classify(_asset('autostart_nu_auto_4.png'))
-        assert cat == 'main'
-        assert grp is None
-
-    def test_nu_cloud_conflict_degrades(self):
-        """雲端衝突複本 '4 (1)' 應退化為一般分類，不被誤判為 NU 群組"""
-        cat, grp = self.classifier.classify(_asset('autostart_nu_auto_4 (1).png'))
-        assert cat == 'main'
-        assert grp is None
-
-    def test_nu_cloud_conflict_various(self):
-        """多種雲端衝突格式都應退化"""
-        for name in ['autostart_nu_auto_5 (1).png', 'autostart_nu_auto_9（2）.png']:
-            cat, grp = self.classifier.classify(_asset(name))
-            assert cat == 'main', f'{name} 應退化為 main，實際: {cat}'
-            assert grp is None
-
-    # ── 欄位不足（非 NU）──────────────────────────────────────
-
-    def test_insufficient_fields_falls_back_to_scene(self):
-        cat, grp = self.classifier.classify(_asset('loading_bar.png'))
-        assert cat == 'loading'
-        assert grp is None
-
-    def test_insufficient_fields_main(self):
-        cat, grp = self.classifier.classify(_asset('base_img.png'))
-        assert cat == 'main'
-        assert grp is None
-
     # ── lang_codes 從外部傳入 ─────────────────────────────────
 
     def test_custom_lang_codes(self):
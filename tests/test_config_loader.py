@@ -0,0 +1,137 @@
+"""
+測試 ConfigLoader.load 的解析快取
+"""
+
+import os
+import pytest
+from utils.config_loader import ConfigLoader, _parse_yaml
+
+
+_CONFIG = """\
+project: {{name: demo, type: slot_game}}
+confluence:
+  url: https://example.atlassian.net
+  page_id: "{page_id}"
+  email: a@example.com
+  api_token: ${{CSS_TEST_TOKEN}}
+  user_account_id: u1
+sync: {{target_folder: ./assets}}
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setenv('CSS_TEST_TOKEN', 'token-1')
+    _parse_yaml.cache_clear()
+    path = tmp_path / 'config.yaml'
+    path.write_text(_CONFIG.format(page_id='100'), encoding='utf-8')
+    return path
+
+
+class TestConfigLoaderCache:
+
+    def test_unchanged_file_parsed_once(self, config_file):
+        """檔案未變更 → 第二次載入命中快取"""
+        ConfigLoader.load(str(config_file))
+        ConfigLoader.load(str(config_file))
+        info = _parse_yaml.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_modified_file_reloaded(self, config_file):
+        """檔案內容變更（mtime / size 改變）→ 重新解析"""
+        assert ConfigLoader.load(str(config_file))['confluence']['page_id'] == '100'
+
+        config_file.write_text(_CONFIG.format(page_id='200200'), encoding='utf-8')
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert ConfigLoader.load(str(config_file))['confluence']['page_id'] == '200200'
+
+    def test_env_vars_reapplied_per_load(self, config_file, monkeypatch):
+        """環境變數每次重新套用，不受解析快取影響"""
+        first = ConfigLoader.load(str(config_file))
+
+        monkeypatch.setenv('CSS_TEST_TOKEN', 'token-2')
+        second = ConfigLoader.load(str(config_file))
+
+        assert first['confluence']['api_token'] == 'token-1'
+        assert second['confluence']['api_token'] == 'token-2'
+
+    def test_untouched_subtrees_shared(self, config_file):
+        """不含環境變數的子樹直接沿用，只有替換路徑上的 dict 被複製"""
+        raw = ConfigLoader.load(str(config_file))
+        again = ConfigLoader.load(str(config_file))
+
+        assert again['project'] is raw['project']
+        assert again['confluence'] is not raw['confluence']
+
+    def test_utf8_bom_and_cjk(self, config_file):
+        """以二進位讀檔：帶 BOM 的 UTF-8 與中文值皆正確解析"""
+        text = _CONFIG.format(page_id='100').replace('name: demo', 'name: 老虎機')
+        config_file.write_bytes(text.encode('utf-8-sig'))
+
+        assert ConfigLoader.load(str(config_file))['project']['name'] == '老虎機'
+
+    def test_all_missing_env_vars_reported_at_once(self, config_file, monkeypatch):
+        """多個環境變數未設定 → 一次列出全部"""
+        monkeypatch.delenv('CSS_TEST_TOKEN')
+        text = _CONFIG.format(page_id='${CSS_TEST_PAGE}')
+        config_file.write_text(text, encoding='utf-8')
+
+        with pytest.raises(ValueError) as exc:
+            ConfigLoader.load(str(config_file))
+        assert 'CSS_TEST_PAGE' in str(exc.value)
+        assert 'CSS_TEST_TOKEN' in str(exc.value)
+
+    def test_all_missing_fields_reported_at_once(self, config_file):
+        """缺少多個必要欄位 → 一次列出全部"""
+        text = _CONFIG.format(page_id='100').replace('  email: a@example.com\n', '')
+        text = text.replace('sync: {target_folder: ./assets}\n', '')
+        config_file.write_text(text, encoding='utf-8')
+
+        with pytest.raises(ValueError) as exc:
+            ConfigLoader.load(str(config_file))
+        assert 'confluence.email' in str(exc.value)
+        assert 'sync.target_folder' in str(exc.value)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ConfigLoader.load(str(tmp_path / 'missing.yaml'))
+
+
+class TestGetNested:
+
+    CONFIG = {'sync': {'max_workers': {'download': 8}, 'target_folder': None}}
+
+    @pytest.mark.parametrize('path, expected', [
+        ('sync.max_workers.download', 8),
+        ('sync.target_folder',        None),
+        ('sync.max_workers.upload',   15),     # 鍵不存在 → 預設值
+        ('sync.target_folder.x',      15),     # 中途不是 dict → 預設值
+    ])
+    def test_lookup(self, path, expected):
+        assert ConfigLoader.get_nested(self.CONFIG, path, 15) == expected
+
+
+class TestLoadConfigPaths:
+
+    def test_keeps_order_and_reports_missing_in_order(self, tmp_path, capsys):
+        a, b = tmp_path / 'a.yaml', tmp_path / 'b.yaml'
+        a.write_text('x: 1')
+        b.write_text('x: 2')
+        raw = [str(b), str(tmp_path / 'z.yaml'), str(a), str(tmp_path / 'y.yaml'), str(tmp_path / 'z.yaml')]
+
+        assert ConfigLoader.load_config_paths(configs=raw) == [str(b), str(a)]
+        out = capsys.readouterr().out.splitlines()
+        assert out == [
+            f"⚠️  跳過不存在的配置：{tmp_path / 'z.yaml'}",
+            f"⚠️  跳過不存在的配置：{tmp_path / 'y.yaml'}",
+        ]
+
+    def test_no_valid_config_exits(self, tmp_path):
+        with pytest.raises(SystemExit):
+            ConfigLoader.load_config_paths(configs=[str(tmp_path / 'missing.yaml')])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
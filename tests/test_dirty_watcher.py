@@ -1,97 +1,73 @@
 # tests/test_dirty_watcher.py
 """
 測試 ProjectInstance._on_file_change
-A 方案：dirty + 合併觸發（Timer window）
+A 方案：dirty + 合併觸發（單一 debounce worker）
 
 測試目標：
 1) 多次連續檔案事件 → 合併為一次 sync
 2) sync_lock 被占用時 → 不丟事件，會排 retry（但不會在測試中無限重試）
 3) sync 進行中再有事件 → sync 結束後補跑「一輪」
+4) 窗口內新事件會延後截止時間；大量事件只啟動一個 worker
+5) stop_monitoring 後的事件不會再啟動 worker，舊 worker 也不會再同步
 """
 
 import threading
 import pytest
 
+import multi_project_manager
 from multi_project_manager import ProjectInstance
 
 
 # ----------------------------------------------------------------------
-# 測試用假物件
+# 測試用假物件（logger / engine 替身見 conftest.py）
 # ----------------------------------------------------------------------
 
-class DummyLogger:
-    def __init__(self):
-        self.records = []
-
-    def info(self, icon, msg, **kwargs):
-        self.records.append(("info", icon, msg))
+class FakeClock:
+    """
+    可控時鐘：取代 multi_project_manager 內的 time 模組
+    - monotonic() 回傳假時間
+    - sleep() 不真的等待，只把假時間往前推（FakeStop.wait 經由它推進）
+    """
 
-    def warning(self, icon, msg, **kwargs):
-        self.records.append(("warning", icon, msg))
+    def __init__(self):
+        self.now = 1000.0
 
-    def error(self, icon, msg, **kwargs):
-        self.records.append(("error", icon, msg))
+    def monotonic(self):
+        return self.now
 
+    def sleep(self, seconds):
+        self.now += seconds
 
-class DummyEngine:
-    def __init__(self, on_run=None):
-        self.calls = []
-        self.on_run = on_run
 
-    def run_sync(self, is_startup=False, log_reason="Sync", dry_run=False, notes_dirty=False):
-        self.calls.append((is_startup, log_reason, dry_run))
-        if self.on_run:
-            self.on_run()
+class FakeStop(threading.Event):
+    """worker 的停止事件：wait 不真的等待，只推進假時鐘"""
 
-    def run_notes_only_sync(self, log_reason="Notes Update"):
-        pass
+    def wait(self, timeout=None):
+        multi_project_manager.time.sleep(timeout)
+        return self.is_set()
 
 
-class FakeTimer:
+class FakeWorker:
     """
-    可控 Timer：
-    - start() 不等時間，只排入 queue
-    - 測試端自己決定 fire() 何時執行
+    取代 _start_debounce_worker：不真的開 thread，
+    worker 迴圈由測試端以 _debounce_tick() 手動推進
     """
-    timers = []
-
-    def __init__(self, delay, func):
-        self.delay = delay
-        self.func = func
-        self.cancelled = False
-        self.daemon = False
+    started = []
 
-    def cancel(self):
-        self.cancelled = True
+    @staticmethod
+    def start(project):
+        FakeWorker.started.append(project)
+        return FakeStop()
 
-    def start(self):
-        FakeTimer.timers.append(self)
 
-    def fire(self):
-        if not self.cancelled:
-            self.func()
-
-
-def fire_next_timer():
-    """只 fire 下一個 timer（避免 lock busy 情境下無限追 timer）"""
-    assert FakeTimer.timers, "No timers to fire"
-    t = FakeTimer.timers.pop(0)
-    t.fire()
-
-
-def fire_all_current_timers():
-    """
-    fire「當下已排入 queue」的 timers（不包含 fire 過程中新排的）。
-    用來模擬：合併窗口到期後、或某個階段的 timer 全部跑完。
-    """
-    current = FakeTimer.timers[:]
-    FakeTimer.timers.clear()
-    for t in current:
-        t.fire()
+def fire_next(p):
+    """worker 處理下一輪：等到截止時間後 drain 一次"""
+    assert p._wake.is_set(), "No pending debounce"
+    p._debounce_tick(p._debounce_stop)
 
 
-def assert_timer_count_at_least(n: int):
-    assert len(FakeTimer.timers) >= n, f"Expected at least {n} timers, got {len(FakeTimer.timers)}"
+def assert_pending(p):
+    assert p._wake.is_set(), "Expected a pending debounce round"
 
 
 # ----------------------------------------------------------------------
@@ -99,15 +75,17 @@ def assert_timer_count_at_least(n: int):
 # ----------------------------------------------------------------------
 
 @pytest.fixture(autouse=True)
-def patch_threading_timer(monkeypatch):
-    FakeTimer.timers.clear()
-    monkeypatch.setattr(threading, "Timer", FakeTimer)
-    yield
-    FakeTimer.timers.clear()
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    FakeWorker.started.clear()
+    monkeypatch.setattr(multi_project_manager, "time", clock)
+    monkeypatch.setattr(ProjectInstance, "_start_debounce_worker", FakeWorker.start)
+    yield clock
+    FakeWorker.started.clear()
 
 
 @pytest.fixture
-def dummy_project():
+def dummy_project(dummy_logger, dummy_engine):
     """
     建立一個「繞過 __init__」的 ProjectInstance：
     - 不讀 config
@@ -117,8 +95,9 @@ def dummy_project():
     p = ProjectInstance.__new__(ProjectInstance)
     p.project_id = "P1"
     p.sync_lock = threading.Lock()
-    p.logger = DummyLogger()
-    p.engine = DummyEngine()
+    p.logger = dummy_logger
+    p.engine = dummy_engine
+    p.monitor = None
     return p
 
 
@@ -136,11 +115,12 @@ def test_multiple_events_merge_into_one_sync(dummy_project):
     p._on_file_change()
     p._on_file_change()
 
-    # 合併窗口到期：只需要把「當下」排到的 timer 跑掉
-    fire_all_current_timers()
+    # 合併窗口到期：worker 只跑一輪
+    fire_next(p)
 
-    assert len(p.engine.calls) == 1
-    assert p.engine.calls[0][1] == "Watcher Sync (dirty)"
+    p.engine.run_sync.assert_called_once()
+    assert p.engine.run_sync.call_args.kwargs["log_reason"] == "Watcher Sync (dirty)"
+    assert not p._wake.is_set()
 
 
 def test_lock_busy_will_retry_not_drop(dummy_project):
@@ -155,26 +135,26 @@ def test_lock_busy_will_retry_not_drop(dummy_project):
 
     p._on_file_change()
 
-    # 1) 先 fire 合併窗口那顆 timer：它會發現 lock 忙 → 排一顆 retry timer
-    fire_next_timer()
+    # 1) 合併窗口到期：發現 lock 忙 → 排 retry
+    fire_next(p)
 
     # 仍然不能同步
-    assert len(p.engine.calls) == 0
+    p.engine.run_sync.assert_not_called()
 
-    # 應該已經排了 retry timer（至少 1 顆）
-    assert_timer_count_at_least(1)
+    # 應該已經排了 retry
+    assert_pending(p)
 
     # 2) 放掉 lock
     p.sync_lock.release()
 
-    # 3) fire 下一顆（retry timer）：這次應該能同步成功
-    fire_next_timer()
+    # 3) retry 到期：這次應該能同步成功
+    fire_next(p)
 
-    assert len(p.engine.calls) == 1
-    assert p.engine.calls[0][1] == "Watcher Sync (dirty)"
+    p.engine.run_sync.assert_called_once()
+    assert p.engine.run_sync.call_args.kwargs["log_reason"] == "Watcher Sync (dirty)"
 
 
-def test_change_during_sync_triggers_followup_sync():
+def test_change_during_sync_triggers_followup_sync(dummy_project):
     """
     sync 進行中再觸發變更 → sync 結束後補跑「一輪」
 
@@ -182,28 +162,80 @@ def test_change_during_sync_triggers_followup_sync():
     """
     trigger_count = {"n": 0}
 
-    def on_run():
+    def on_run(**kwargs):
         # 只在第一次 run_sync 的途中再觸發一次變更
         if trigger_count["n"] == 0:
             trigger_count["n"] += 1
             p._on_file_change()
 
-    p = ProjectInstance.__new__(ProjectInstance)
-    p.project_id = "P1"
-    p.sync_lock = threading.Lock()
-    p.logger = DummyLogger()
-    p.engine = DummyEngine(on_run=on_run)
+    p = dummy_project
+    p.engine.run_sync.side_effect = on_run
 
     p._on_file_change()
 
     # 第一次合併窗口到期 → 跑第一輪 sync（期間又 dirty 一次）
-    fire_all_current_timers()
+    fire_next(p)
 
-    # 此時應該已排「補跑」的下一輪 timer（合併窗口）
-    assert_timer_count_at_least(1)
+    # 此時應該已排「補跑」的下一輪（合併窗口）
+    assert_pending(p)
 
     # 第二次合併窗口到期 → 跑第二輪 sync（這次 on_run 不再 dirty）
-    fire_all_current_timers()
+    fire_next(p)
+
+    assert p.engine.run_sync.call_count == 2
+    assert all(
+        c.kwargs["log_reason"] == "Watcher Sync (dirty)"
+        for c in p.engine.run_sync.call_args_list
+    )
+
+
+def test_events_extend_merge_window(dummy_project, fake_clock):
+    """
+    窗口內持續有事件 → 截止時間往後延，只在最後一個事件後滿一個窗口才同步
+    """
+    p = dummy_project
+
+    p._on_file_change()
+    start = fake_clock.now
+    fake_clock.now += 1.0
+    p._on_file_change()
+
+    fire_next(p)
+
+    p.engine.run_sync.assert_called_once()
+    assert fake_clock.now >= start + 1.0 + ProjectInstance.MERGE_WINDOW_S
+
+
+def test_single_worker_thread_for_many_events(dummy_project):
+    """
+    大量事件只啟動一個 debounce worker，不會每個事件開一個 thread
+    """
+    p = dummy_project
+
+    for _ in range(100):
+        p._on_file_change()
+
+    assert FakeWorker.started == [p]
+
+
+def test_event_after_stop_does_not_restart_worker(dummy_project):
+    """
+    stop_monitoring 之後才到的事件：不啟動第二個 worker，
+    舊 worker 的停止事件維持已設定，等待中的 tick 直接結束、不會同步
+    """
+    p = dummy_project
+
+    p._on_file_change()
+    old_stop = p._debounce_stop
+
+    p.stop_monitoring()
+    assert old_stop.is_set()
+
+    p._on_file_change()
+
+    assert FakeWorker.started == [p]
+    assert p._debounce_stop is None
 
-    assert len(p.engine.calls) == 2
-    assert all(call[1] == "Watcher Sync (dirty)" for call in p.engine.calls)
+    # 舊 worker 即使還卡在等待截止時間，醒來後也不會 drain
+    p._debounce_tick(old_stop)
+    p.engine.run_sync.assert_not_called()
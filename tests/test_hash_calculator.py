@@ -17,7 +17,7 @@ class TestHashCalculator:
         hash2 = HashCalculator.calculate(data)
         
         assert hash1 == hash2
-        assert len(hash1) == 32  # MD5 為 32 位十六進位
+        assert len(hash1) == 32  # 固定 32 位十六進位（MD5 / BLAKE3 皆同）
     
     def test_calculate_from_bytesio(self):
         """測試從 BytesIO 計算哈希"""
@@ -29,6 +29,28 @@ class TestHashCalculator:
         
         assert hash1 == hash2
     
+    def test_calculate_from_path(self, tmp_path):
+        """測試從檔案路徑串流計算，與 bytes 結果一致"""
+        data = b"\x89PNG" * 300_000   # 超過一個讀取區塊
+        path = tmp_path / "asset.png"
+        path.write_bytes(data)
+
+        assert HashCalculator.calculate(str(path)) == HashCalculator.calculate(data)
+
+    def test_bytesio_ignores_read_position(self):
+        """BytesIO 已被讀過（位置不在開頭）仍計算完整內容"""
+        data = b"Test data"
+        bio = BytesIO(data)
+        bio.read()
+
+        assert HashCalculator.calculate(bio) == HashCalculator.calculate(data)
+
+    def test_md5_fallback_matches_hashlib(self, monkeypatch):
+        """HASH_ALGO=md5 時結果與 hashlib.md5 一致（遷移期間相容舊快取）"""
+        import hashlib
+        monkeypatch.setattr(HashCalculator, 'ALGORITHM', 'md5')
+        assert HashCalculator.calculate(b"abc") == hashlib.md5(b"abc").hexdigest()
+
     def test_compare_hashes(self):
         """測試哈希比較"""
         hash1 = "abc123def456"
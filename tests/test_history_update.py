@@ -0,0 +1,62 @@
+# tests/test_history_update.py
+"""
+測試 SlotGameSyncEngine._update_history_only
+
+測試目標：
+1) 標題後緊接 table → 只替換 table，頁面其餘內容原樣保留
+2) 標題與 table 之間夾有其他節點 → 走 BeautifulSoup 路徑仍能替換
+"""
+
+import pytest
+
+from projects.slot_game.sync_engine import SlotGameSyncEngine
+from projects.slot_game.page_builder import SlotGamePageBuilder
+
+
+class DummyState:
+    def __init__(self, history):
+        self._history = history
+
+    def get_history_slice(self, keep):
+        return self._history[:keep]
+
+
+@pytest.fixture
+def engine():
+    """繞過 __init__ 的最小 SlotGameSyncEngine"""
+    e = SlotGameSyncEngine.__new__(SlotGameSyncEngine)
+    e.page_builder = SlotGamePageBuilder()
+    e.history_keep = 5
+    e.state = DummyState([
+        {'date': '2026-01-02', 'log': 'new entry', 'user_id': 'u2'},
+        {'date': '2026-01-01', 'log': 'old entry', 'user_id': 'u1'},
+    ])
+    return e
+
+
+def test_history_table_spliced_in_place(engine):
+    page = (
+        '<p>before</p>'
+        '<h2 id="x">📝 更新紀錄</h2>'
+        '<table data-layout="default"><tbody><tr><td>stale</td></tr></tbody></table>'
+        '<h2>other</h2><table><tbody><tr><td>keep</td></tr></tbody></table>'
+    )
+    result = engine._update_history_only(page)
+
+    assert result.startswith('<p>before</p><h2 id="x">📝 更新紀錄</h2><table>')
+    assert 'stale' not in result
+    assert 'new entry' in result and 'old entry' in result
+    assert result.endswith('<h2>other</h2><table><tbody><tr><td>keep</td></tr></tbody></table>')
+    assert result.count('更新紀錄') == 1
+
+
+def test_history_table_fallback_to_soup(engine):
+    page = (
+        '<h2>📝 更新紀錄</h2><p>note</p>'
+        '<table><tbody><tr><td>stale</td></tr></tbody></table>'
+    )
+    result = engine._update_history_only(page)
+
+    assert 'stale' not in result
+    assert 'new entry' in result
+    assert '<p>note</p>' in result
@@ -0,0 +1,76 @@
+"""
+測試 SyncLogger：handler 配置
+"""
+
+import logging
+
+import pytest
+
+from utils.logger import SyncLogger, _SecondCachedFormatter
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    """建立測試用 SyncLogger，結束時移除並關閉其 handler"""
+    created = []
+
+    def make(name):
+        sl = SyncLogger(name, log_dir=str(tmp_path))
+        created.append(sl.logger)
+        return sl
+
+    yield make
+    for logger in created:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+
+
+class TestSyncLogger:
+
+    def test_console_handler_shared_across_projects(self, make_logger):
+        """不同專案共用同一個終端 handler，檔案 handler 各自獨立"""
+        a = make_logger('test_logger_A')
+        b = make_logger('test_logger_B')
+
+        console_a = [h for h in a.logger.handlers if not isinstance(h, logging.FileHandler)]
+        console_b = [h for h in b.logger.handlers if not isinstance(h, logging.FileHandler)]
+        assert len(console_a) == 1 and console_a == console_b
+
+        file_a = [h for h in a.logger.handlers if isinstance(h, logging.FileHandler)]
+        file_b = [h for h in b.logger.handlers if isinstance(h, logging.FileHandler)]
+        assert len(file_a) == 1 and len(file_b) == 1
+        assert file_a[0].baseFilename != file_b[0].baseFilename
+
+    def test_same_name_does_not_duplicate_handlers(self, make_logger):
+        a = make_logger('test_logger_C')
+        b = make_logger('test_logger_C')
+        assert a.logger is b.logger
+        assert len(a.logger.handlers) == 2
+
+    def test_writes_icon_and_message_to_file(self, make_logger, tmp_path):
+        sl = make_logger('test_logger_D')
+        sl.info('📤', '上傳完成')
+        sl.debug('細節')
+        for handler in sl.logger.handlers:
+            handler.flush()
+
+        text = next(tmp_path.glob('test_logger_D_*.log')).read_text(encoding='utf-8')
+        assert 'test_logger_D - INFO - 📤 上傳完成' in text
+        assert '細節' not in text   # logger 本身為 INFO 級別
+
+    def test_cached_formatter_matches_logging_formatter(self):
+        """同一秒沿用快取、跨秒重新格式化，輸出與標準 Formatter 相同"""
+        fmt, datefmt = '%(asctime)s - %(message)s', '%Y-%m-%d %H:%M:%S'
+        std = logging.Formatter(fmt, datefmt)
+        fast = _SecondCachedFormatter(fmt, datefmt)
+
+        for created in (1700000000.1, 1700000000.9, 1700000001.0, 1700000000.5):
+            record = logging.LogRecord('n', logging.INFO, 'p', 1, 'msg', None, None)
+            record.created = created
+            assert fast.format(record) == std.format(record)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
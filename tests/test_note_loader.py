@@ -0,0 +1,183 @@
+"""
+測試 NoteLoader：xlsx A、B 欄讀取
+"""
+
+import zipfile
+
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from utils.note_loader import NoteLoader
+
+
+def _write_xlsx(path, rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+_M = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_P = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def _write_shared_strings_xlsx(path):
+    """Excel 風格：共用字串、rich text、注音標示、相對路徑 Target"""
+    files = {
+        '[Content_Types].xml':
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '</Types>',
+        '_rels/.rels':
+            f'<Relationships xmlns="{_P}"><Relationship Id="rId1" Type="{_R}/officeDocument" Target="xl/workbook.xml"/></Relationships>',
+        'xl/workbook.xml':
+            f'<workbook xmlns="{_M}" xmlns:r="{_R}"><sheets><sheet name="S" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        'xl/_rels/workbook.xml.rels':
+            f'<Relationships xmlns="{_P}">'
+            f'<Relationship Id="rId1" Type="{_R}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{_R}/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>',
+        'xl/sharedStrings.xml':
+            f'<sst xmlns="{_M}">'
+            '<si><t>main_bg.png</t></si>'
+            '<si><r><t>背景</t></r><r><t xml:space="preserve"> 圖 </t></r></si>'
+            '<si><t>漢字</t><rPh sb="0" eb="2"><t>かんじ</t></rPh></si>'
+            '</sst>',
+        'xl/worksheets/sheet1.xml':
+            f'<worksheet xmlns="{_M}"><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c></row>'
+            '<row r="2"><c r="A2" t="s"><v>2</v></c><c r="C2"><v>9</v></c></row>'
+            '<row r="3"><c r="B3" t="s"><v>0</v></c></row>'
+            '<row r="4"><c r="A4" t="str"><v>formula</v></c><c r="B4" t="b"><v>1</v></c></row>'
+            '</sheetData></worksheet>',
+    }
+    with zipfile.ZipFile(path, 'w') as z:
+        for name, data in files.items():
+            z.writestr(name, data)
+
+
+class TestNoteLoader:
+
+    def test_reads_first_two_columns(self, tmp_path):
+        """只取 A、B 欄；多餘欄位忽略，空 key 略過，值去除前後空白"""
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [
+            ['main_bg.png', ' 背景 ', 'extra', 'extra'],
+            ['main_btn_start'],
+            [None, 'orphan'],
+            ['  ', 'blank key'],
+            [' main_nu_win ', 5],
+        ])
+        loader = NoteLoader(str(path))
+
+        assert loader.as_dict() == {
+            'main_bg.png':    '背景',
+            'main_btn_start': '',
+            'main_nu_win':    '5',
+        }
+
+    def test_reload_picks_up_changes(self, tmp_path):
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [['a.png', 'old']])
+        loader = NoteLoader(str(path))
+
+        _write_xlsx(path, [['a.png', 'new'], ['b.png', 'added']])
+        assert loader.reload() is True
+        assert loader.get('a.png') == 'new'
+        assert loader.get('b.png') == 'added'
+
+    def test_get_falls_back_to_stem(self, tmp_path):
+        """完整檔名優先，其次去掉最後一段副檔名；空說明也算命中"""
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [
+            ['main_bg.png', ''],
+            ['main_bg', 'stem'],
+            ['main_btn_start', '開始'],
+            ['fx.tar', 'tar'],
+        ])
+        loader = NoteLoader(str(path))
+
+        assert loader.get('main_bg.png') == ''
+        assert loader.get('main_bg.jpg') == 'stem'
+        assert loader.get('main_btn_start.png') == '開始'
+        assert loader.get('fx.tar.gz') == 'tar'
+        assert loader.get('other.png') == ''
+
+    def test_reload_skips_unchanged_file(self, tmp_path, monkeypatch):
+        """修改時間與大小未變 → 不重新解析，仍回傳 True"""
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [['a.png', 'old']])
+        loader = NoteLoader(str(path))
+
+        def fail():
+            raise AssertionError('不應重新解析')
+        monkeypatch.setattr(loader, '_read_notes', fail)
+
+        assert loader.reload() is True
+        assert loader.get('a.png') == 'old'
+
+    def test_xml_reader_matches_openpyxl(self, tmp_path):
+        """直接解析與 openpyxl 讀到的 A、B 欄一致（字串、數值、布林、公式、空格）"""
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [
+            ['a.png', 'note', 'x'],
+            [1, 2.5],
+            [None, 'orphan'],
+            ['b', True],
+            ['c', '=1+1'],
+            [' 中文 ', 1e20],
+        ])
+        loader = NoteLoader(str(path))
+
+        assert loader._iter_rows_xml() == loader._iter_rows_openpyxl()
+
+    def test_reads_shared_strings(self, tmp_path):
+        """Excel 存檔的共用字串：rich text 串接、略過注音標示"""
+        path = tmp_path / 'notes.xlsx'
+        _write_shared_strings_xlsx(path)
+        loader = NoteLoader(str(path))
+
+        assert loader._iter_rows_xml() == loader._iter_rows_openpyxl()
+        assert loader.as_dict() == {
+            'main_bg.png': '背景 圖',
+            '漢字':        '',
+            'formula':     'True',
+        }
+
+    def test_reads_active_sheet(self, tmp_path):
+        """與 openpyxl 的 wb.active 相同：讀作用中工作表而非第一張"""
+        path = tmp_path / 'notes.xlsx'
+        wb = openpyxl.Workbook()
+        wb.active.append(['first.png', 'first'])
+        wb.create_sheet('notes').append(['second.png', 'second'])
+        wb.active = 1
+        wb.save(path)
+
+        assert NoteLoader(str(path)).as_dict() == {'second.png': 'second'}
+
+    def test_falls_back_to_openpyxl(self, tmp_path, monkeypatch):
+        """直接解析失敗時改用 openpyxl"""
+        path = tmp_path / 'notes.xlsx'
+        _write_xlsx(path, [['a.png', 'note']])
+
+        def broken(self):
+            raise KeyError('xl/workbook.xml')
+        monkeypatch.setattr(NoteLoader, '_iter_rows_xml', broken)
+
+        assert NoteLoader(str(path)).as_dict() == {'a.png': 'note'}
+
+    def test_missing_file_is_empty(self, tmp_path):
+        loader = NoteLoader(str(tmp_path / 'missing.xlsx'))
+        assert loader.is_empty()
+        assert loader.reload() is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -16,89 +16,79 @@
 """
 
 import threading
-import time
 import pytest
 
+import multi_project_manager
 from multi_project_manager import ProjectInstance
 
 
-# ── 假物件 ────────────────────────────────────────────────────────────────────
+# ── 假物件（logger / engine 替身見 conftest.py）───────────────────────────────
 
-class DummyLogger:
-    def info(self, *a, **kw):    pass
-    def warning(self, *a, **kw): pass
-    def error(self, *a, **kw):   pass
-    def success(self, *a, **kw): pass
+class FakeClock:
+    """取代 multi_project_manager.time：sleep 只推進假時間"""
 
+    def __init__(self):
+        self.now = 1000.0
 
-class DummyEngine:
-    """記錄每次 run_sync / run_notes_only_sync 的呼叫參數"""
+    def monotonic(self):
+        return self.now
 
-    def __init__(self, on_run=None):
-        self.sync_calls        = []   # [(is_startup, log_reason, notes_dirty)]
-        self.notes_only_calls  = []   # [log_reason]
-        self.on_run = on_run
+    def sleep(self, seconds):
+        self.now += seconds
 
-    def run_sync(self, is_startup=False, log_reason="Sync",
-                 dry_run=False, notes_dirty=False):
-        self.sync_calls.append((is_startup, log_reason, notes_dirty))
-        if self.on_run:
-            self.on_run()
 
-    def run_notes_only_sync(self, log_reason="Notes Update"):
-        self.notes_only_calls.append(log_reason)
+class FakeStop(threading.Event):
+    """worker 的停止事件：wait 只推進假時間"""
+
+    def wait(self, timeout=None):
+        multi_project_manager.time.sleep(timeout)
+        return self.is_set()
+
+
+def fake_start_worker(project):
+    """不真的開 thread；worker 由測試端以 _debounce_tick() 推進"""
+    return FakeStop()
 
 
 class FakeTimer:
-    timers: list = []
+    """FileMonitor 仍以 Timer 防抖，9、10 測試只需它不真的啟動"""
+
+    __slots__ = ('delay', 'func', 'daemon')
 
     def __init__(self, delay, func):
         self.delay = delay
         self.func = func
-        self.cancelled = False
         self.daemon = False
 
     def cancel(self):
-        self.cancelled = True
+        pass
 
     def start(self):
-        FakeTimer.timers.append(self)
-
-    def fire(self):
-        if not self.cancelled:
-            self.func()
-
-
-def fire_next():
-    assert FakeTimer.timers, "No timers to fire"
-    FakeTimer.timers.pop(0).fire()
+        pass
 
 
-def fire_all_current():
-    batch = FakeTimer.timers[:]
-    FakeTimer.timers.clear()
-    for t in batch:
-        t.fire()
+def fire_next(p):
+    assert p._wake.is_set(), "No pending debounce"
+    p._debounce_tick(p._debounce_stop)
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
 @pytest.fixture(autouse=True)
-def patch_timer(monkeypatch):
-    FakeTimer.timers.clear()
+def patch_worker(monkeypatch):
+    monkeypatch.setattr(multi_project_manager, "time", FakeClock())
+    monkeypatch.setattr(ProjectInstance, "_start_debounce_worker", fake_start_worker)
     monkeypatch.setattr(threading, "Timer", FakeTimer)
-    yield
-    FakeTimer.timers.clear()
 
 
 @pytest.fixture
-def proj():
+def proj(dummy_logger, dummy_engine):
     """繞過 __init__ 的最小 ProjectInstance"""
     p = ProjectInstance.__new__(ProjectInstance)
     p.project_id = "P1"
     p.sync_lock  = threading.Lock()
-    p.logger     = DummyLogger()
-    p.engine     = DummyEngine()
+    p.logger     = dummy_logger
+    p.engine     = dummy_engine
     return p
 
 
@@ -107,10 +97,10 @@ def proj():
 def test_only_notes_change_calls_notes_only_sync(proj):
     """只改 xlsx（notes_dirty=True）→ run_sync 收到 notes_dirty=True"""
     proj._on_file_change(notes_dirty=True)
-    fire_all_current()
+    fire_next(proj)
 
-    assert len(proj.engine.sync_calls) == 1
-    _, _, nd = proj.engine.sync_calls[0]
+    assert proj.engine.run_sync.call_count == 1
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is True
 
 
@@ -119,10 +109,10 @@ def test_only_notes_change_calls_notes_only_sync(proj):
 def test_only_image_change_notes_dirty_false(proj):
     """只改圖片 → notes_dirty=False"""
     proj._on_file_change(notes_dirty=False)
-    fire_all_current()
+    fire_next(proj)
 
-    assert len(proj.engine.sync_calls) == 1
-    _, _, nd = proj.engine.sync_calls[0]
+    assert proj.engine.run_sync.call_count == 1
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is False
 
 
@@ -133,10 +123,10 @@ def test_image_and_notes_same_window_notes_dirty_true(proj):
     proj._on_file_change(notes_dirty=False)  # 圖片
     proj._on_file_change(notes_dirty=True)   # xlsx
     proj._on_file_change(notes_dirty=False)  # 再一張圖片
-    fire_all_current()
+    fire_next(proj)
 
-    assert len(proj.engine.sync_calls) == 1
-    _, _, nd = proj.engine.sync_calls[0]
+    assert proj.engine.run_sync.call_count == 1
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is True
 
 
@@ -146,9 +136,9 @@ def test_notes_first_then_image_preserves_notes_dirty(proj):
     """xlsx 先觸發，後來圖片事件不應清掉 notes_dirty"""
     proj._on_file_change(notes_dirty=True)   # xlsx 先
     proj._on_file_change(notes_dirty=False)  # 圖片後
-    fire_all_current()
+    fire_next(proj)
 
-    _, _, nd = proj.engine.sync_calls[0]
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is True, "notes_dirty 被圖片事件清掉了！"
 
 
@@ -158,9 +148,9 @@ def test_image_first_then_notes_sets_notes_dirty(proj):
     """圖片先觸發，xlsx 後到 → 最終 notes_dirty=True"""
     proj._on_file_change(notes_dirty=False)  # 圖片先
     proj._on_file_change(notes_dirty=True)   # xlsx 後
-    fire_all_current()
+    fire_next(proj)
 
-    _, _, nd = proj.engine.sync_calls[0]
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is True
 
 
@@ -168,21 +158,21 @@ def test_image_first_then_notes_sets_notes_dirty(proj):
 
 def test_notes_change_during_sync_preserved_in_followup(proj):
     """第一輪 sync 跑到一半 xlsx 被改 → 補跑時 notes_dirty=True"""
-    def on_run():
+    def on_run(**kwargs):
         # 模擬 sync 進行中 xlsx 被儲存
         proj._on_file_change(notes_dirty=True)
 
-    proj.engine.on_run = on_run
+    proj.engine.run_sync.side_effect = on_run
 
     proj._on_file_change(notes_dirty=False)
-    fire_all_current()   # 第一輪 sync（期間 xlsx dirty）
+    fire_next(proj)   # 第一輪 sync（期間 xlsx dirty）
 
-    # 應有補跑 timer
-    assert FakeTimer.timers, "沒有補跑 timer"
-    fire_all_current()   # 補跑
+    # 應有排補跑
+    assert proj._wake.is_set(), "沒有排補跑"
+    fire_next(proj)   # 補跑
 
-    assert len(proj.engine.sync_calls) == 2
-    _, _, nd = proj.engine.sync_calls[1]
+    assert proj.engine.run_sync.call_count == 2
+    nd = proj.engine.run_sync.call_args_list[1].kwargs['notes_dirty']
     assert nd is True, "補跑時 notes_dirty 遺失"
 
 
@@ -190,17 +180,17 @@ def test_notes_change_during_sync_preserved_in_followup(proj):
 
 def test_image_change_during_sync_followup_notes_dirty_false(proj):
     """第一輪 sync 進行中只有圖片被改 → 補跑 notes_dirty=False"""
-    def on_run():
+    def on_run(**kwargs):
         proj._on_file_change(notes_dirty=False)
 
-    proj.engine.on_run = on_run
+    proj.engine.run_sync.side_effect = on_run
 
     proj._on_file_change(notes_dirty=False)
-    fire_all_current()
-    fire_all_current()
+    fire_next(proj)
+    fire_next(proj)
 
-    assert len(proj.engine.sync_calls) == 2
-    _, _, nd = proj.engine.sync_calls[1]
+    assert proj.engine.run_sync.call_count == 2
+    nd = proj.engine.run_sync.call_args_list[1].kwargs['notes_dirty']
     assert nd is False
 
 
@@ -213,16 +203,16 @@ def test_lock_busy_notes_dirty_preserved_after_retry(proj):
     proj._on_file_change(notes_dirty=True)
 
     # 合併窗口到期 → 發現 lock 忙 → 排 retry
-    fire_next()
-    assert len(proj.engine.sync_calls) == 0
-    assert FakeTimer.timers, "沒有 retry timer"
+    fire_next(proj)
+    assert proj.engine.run_sync.call_count == 0
+    assert proj._wake.is_set(), "沒有排 retry"
 
     proj.sync_lock.release()
 
-    # retry timer 到期 → 這次能拿到 lock
-    fire_next()
-    assert len(proj.engine.sync_calls) == 1
-    _, _, nd = proj.engine.sync_calls[0]
+    # retry 到期 → 這次能拿到 lock
+    fire_next(proj)
+    assert proj.engine.run_sync.call_count == 1
+    nd = proj.engine.run_sync.call_args_list[0].kwargs['notes_dirty']
     assert nd is True, "retry 後 notes_dirty 遺失"
 
 
@@ -0,0 +1,116 @@
+"""
+測試 retry / async_retry：成功路徑、退避延遲、重試耗盡
+"""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.retry import retry, async_retry
+
+retry_module = sys.modules['utils.retry']
+
+
+class Flaky:
+    """前 fails 次呼叫拋出 ValueError，之後回傳呼叫次數"""
+
+    def __init__(self, fails):
+        self.fails = fails
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.fails:
+            raise ValueError(f"fail {self.calls}")
+        return self.calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """記錄 sleep 秒數，不真的等待"""
+    recorded = []
+    monkeypatch.setattr(retry_module.time, 'sleep', recorded.append)
+    return recorded
+
+
+class TestRetry:
+
+    def test_success_calls_once(self, sleeps):
+        func = Flaky(0)
+        assert retry()(func)() == 1
+        assert func.calls == 1
+        assert sleeps == []
+
+    def test_retries_with_backoff(self, sleeps):
+        func = Flaky(2)
+        assert retry(max_attempts=3, delay=1.0, backoff=2.0)(func)() == 3
+        assert sleeps == [1.0, 2.0]
+
+    def test_exhausted_raises_last_error(self, sleeps):
+        func = Flaky(5)
+        with pytest.raises(ValueError, match="fail 3"):
+            retry(max_attempts=3, delay=0.5)(func)()
+        assert func.calls == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_final_error_not_chained_to_first(self, sleeps):
+        """重試在 except 區塊外進行，最後的例外不帶第一次失敗的 __context__"""
+        with pytest.raises(ValueError) as exc:
+            retry(max_attempts=3)(Flaky(5))()
+        assert exc.value.__context__ is None
+
+    def test_other_exceptions_not_retried(self, sleeps):
+        func = Flaky(1)
+        with pytest.raises(ValueError):
+            retry(exceptions=(KeyError,))(func)()
+        assert func.calls == 1
+
+    def test_logger_kwarg_warns_each_retry(self, sleeps):
+        logger = MagicMock()
+        retry(max_attempts=3)(Flaky(2))(logger=logger)
+        assert logger.warning.call_count == 2
+        assert "(1/3)" in logger.warning.call_args_list[0].args[1]
+
+
+class TestAsyncRetry:
+
+    @pytest.fixture
+    def async_sleeps(self, monkeypatch):
+        recorded = []
+
+        async def fake_sleep(seconds):
+            recorded.append(seconds)
+        monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+        return recorded
+
+    @staticmethod
+    def _wrap(fails, **opts):
+        flaky = Flaky(fails)
+
+        @async_retry(**opts)
+        async def func():
+            return flaky()
+        return flaky, func
+
+    def test_retries_with_backoff(self, async_sleeps):
+        flaky, func = self._wrap(2, max_attempts=3, delay=1.0, backoff=3.0)
+        assert asyncio.run(func()) == 3
+        assert async_sleeps == [1.0, 3.0]
+
+    def test_exhausted_raises_last_error(self, async_sleeps):
+        flaky, func = self._wrap(5, max_attempts=2)
+        with pytest.raises(ValueError, match="fail 2"):
+            asyncio.run(func())
+        assert flaky.calls == 2
+
+    def test_final_error_not_chained_to_first(self, async_sleeps):
+        flaky, func = self._wrap(5, max_attempts=3)
+        with pytest.raises(ValueError, match="fail 3") as exc:
+            asyncio.run(func())
+        assert exc.value.__context__ is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,111 @@
+"""
+測試 StateManager 的哈希演算法比對
+"""
+
+import hashlib
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from core.confluence_client import ConfluenceClient
+from core.hash_calculator import HashCalculator
+from core.state_manager import StateManager
+from core.sync_engine import BaseSyncEngine
+
+
+class TestHashAlgorithmMismatch:
+
+    def test_legacy_entries_treated_as_md5(self, tmp_path):
+        """舊快取未記錄 algo → 視為 md5"""
+        sm = StateManager(str(tmp_path / 'c.json'), str(tmp_path / 'h.json'))
+        sm.remote_state = {'a.png': {'id': '1', 'hash': 'x' * 32}}
+
+        assert sm.hash_algorithm_mismatch('md5') is False
+        assert sm.hash_algorithm_mismatch('blake3') is True
+
+    def test_update_remote_file_records_algo(self, tmp_path):
+        """update_remote_file 寫入 algo，之後同演算法不需重新校驗"""
+        sm = StateManager(str(tmp_path / 'c.json'), str(tmp_path / 'h.json'))
+        sm.update_remote_file('a.png', '1', 'x' * 32, algo='blake3')
+
+        assert sm.hash_algorithm_mismatch('blake3') is False
+
+    def test_update_remote_file_requires_algo(self, tmp_path):
+        """algo 無預設值，漏傳時直接報錯而非默默標記為 md5"""
+        sm = StateManager(str(tmp_path / 'c.json'), str(tmp_path / 'h.json'))
+
+        with pytest.raises(TypeError):
+            sm.update_remote_file('a.png', '1', 'x' * 32)
+        assert sm.remote_state == {}
+
+
+# ── 切換演算法後的同步流程 ─────────────────────────────────────────────────
+
+class _Engine(BaseSyncEngine):
+    """只用於測試 run_sync 的最小具體引擎"""
+
+    def classify_assets(self, files):
+        return {}
+
+    def build_page_content(self, categories, history):
+        return ''
+
+
+class TestAlgorithmMigration:
+
+    CONTENT = b'png-bytes'
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch, dummy_logger):
+        monkeypatch.setattr(HashCalculator, 'ALGORITHM', 'md5')
+        md5_hash = HashCalculator.calculate(self.CONTENT)
+
+        # 舊快取：未記錄 algo（視為 md5）
+        cache = tmp_path / 'c.json'
+        cache.write_text(json.dumps({'a.png': {'id': '1', 'hash': md5_hash}}))
+
+        client = MagicMock(spec=ConfluenceClient)
+        client.get_page_content.return_value = ('', 1)
+        client.parse_history_from_page.return_value = []
+        client.get_all_attachments.return_value = [
+            {'title': 'a.png', 'id': '1', '_links': {'download': '/a.png'}},
+        ]
+        client.download_attachment.return_value = self.CONTENT
+
+        e = _Engine.__new__(_Engine)
+        e.client = client
+        e.state = StateManager(str(cache), str(tmp_path / 'h.json'))
+        e.logger = dummy_logger
+        e.max_workers = {'download': 2, 'upload': 2, 'delete': 2}
+        e.file_patterns = {}
+        e.history_keep = 5
+
+        # 切換到另一個演算法（以 sha1 前 32 碼模擬，不依賴 blake3 是否安裝）
+        monkeypatch.setattr(HashCalculator, 'ALGORITHM', 'sha1')
+        monkeypatch.setattr(
+            HashCalculator, 'calculate',
+            staticmethod(lambda src: hashlib.sha1(src).hexdigest()[:32]),
+        )
+        monkeypatch.setattr(
+            e, '_scan_local_files',
+            lambda: {'a.png': {'path': 'a.png', 'hash': HashCalculator.calculate(self.CONTENT)}},
+        )
+        return e
+
+    def test_second_sync_after_switch_is_incremental(self, engine):
+        """切換演算法後第一輪完整校驗並寫回快取，第二輪直接用快取"""
+        engine.run_sync()
+        assert engine.client.get_all_attachments.call_count == 1
+        assert engine.state.hash_algorithm_mismatch('sha1') is False
+
+        # 重新從磁碟載入，確認已存檔
+        reloaded = StateManager(str(engine.state.cache_file), str(engine.state.history_file))
+        assert reloaded.remote_state['a.png']['algo'] == 'sha1'
+
+        engine.run_sync()
+        assert engine.client.get_all_attachments.call_count == 1
+        engine.client.upload_attachment.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -9,16 +9,14 @@
   - validate_group_key()：群組鍵異常偵測
 """
 
-import pytest
-from projects.slot_game.validator import DictLoader, FilenameValidator
+import threading
 
+import pytest
+from projects.slot_game import validator as validator_mod
+from projects.slot_game.validator import DictLoader, FilenameValidator, load_dict
 
-# ── 共用 Fixture ───────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope='module')
-def validator():
-    loader = DictLoader('config/game_dict.yaml')
-    return FilenameValidator(loader)
+# validator fixture 定義於 tests/conftest.py（session 範圍共用）
 
 
 # ── 0. 前置過濾：系統/雲端異常檔名 ───────────────────────────────────────────
@@ -62,6 +60,56 @@ class TestSystemFilenameFilter:
         """欄位間空白"""
         assert validator.validate('main _img_bg_na.png') is not None
 
+    def test_manual_copy_lowercase(self, validator):
+        """「copy」大小寫不拘"""
+        assert validator.validate('main_img_bg_na - copy.png') is not None
+
+    def test_non_ascii_whitespace(self, validator):
+        """全形空白、不換行空白也視為空白字元"""
+        assert validator.validate('main_img_bg_na\u3000.png') is not None
+        assert validator.validate('main_img\xa0_bg_na.png') is not None
+
+
+@pytest.mark.skipif(validator_mod._SYSTEM_DB is None, reason="未安裝 hyperscan")
+class TestSystemFilenameHyperscan:
+
+    def test_scratch_per_thread(self):
+        """並行驗證時每條執行緒使用各自的 scratch"""
+        barrier  = threading.Barrier(4)
+        scratches, errors = [], []
+
+        def worker():
+            barrier.wait()
+            try:
+                for _ in range(200):
+                    assert FilenameValidator._check_system_filename('main_img_bg_na (1).png')
+                scratches.append(validator_mod._SYSTEM_SCRATCH.scratch)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len({id(s) for s in scratches}) == 4
+
+    def test_scan_error_falls_back_to_re(self, monkeypatch):
+        """Hyperscan 掃描失敗 → 退回逐條比對，結果不變"""
+        name     = 'main_img_bg_na - Copy.png'
+        expected = FilenameValidator._check_system_filename(name)
+
+        class BrokenDB:
+            def scan(self, *args, **kwargs):
+                raise validator_mod.hyperscan.error('scratch in use')
+
+        monkeypatch.setattr(validator_mod, '_SYSTEM_DB', BrokenDB())
+        monkeypatch.setattr(validator_mod, '_SYSTEM_SCRATCH', threading.local())
+        assert expected is not None
+        assert FilenameValidator._check_system_filename(name) == expected
+
 
 # ── 1. 欄位數量 ───────────────────────────────────────────────────────────────
 
@@ -115,6 +163,11 @@ class TestSemanticRules:
         # c_n 在第 5 欄含底線，或 validate 先報其他問題皆可
         assert w is not None
 
+    def test_rule2_extra_underscore_reported(self, validator):
+        """超過 5 欄時多出的底線併入第 5 欄 → 規則 2 回報底線"""
+        w = validator.validate('main_img_bg_na_c_n.png')
+        assert '底線' in w
+
     def test_rule3_name_duplicate_reserved(self, validator):
         """name 與保留字詞重複（如 type 中的詞）"""
         # 'nu' 和 'img' 都是 type 欄位的保留詞，確定在 reserved_names 裡
@@ -139,29 +192,35 @@ class TestSemanticRules:
 
     def test_rule5_nu_invalid_suffix(self, validator):
         """type=nu 但第 5 欄不是 bitmap_font"""
-        w = validator._rule5_nu_suffix('nu', 'cn')
+        w = validator._rule5_nu_suffix('cn')
         assert w is not None
         assert 'nu' in w.lower()
 
     def test_rule5_nu_valid_suffix(self, validator):
         """type=nu 且第 5 欄是 bitmap_font → 通過"""
         # '0'~'9' 應在 bitmap_font
-        assert validator._rule5_nu_suffix('nu', '0') is None
+        assert validator._rule5_nu_suffix('0') is None
+
+    def test_rule5_uppercase_type_via_validate(self, validator):
+        """type 大寫（NU）經 validate 轉小寫後仍套用 nu 規則"""
+        w = validator.validate('main_NU_win_na_cn.png')
+        assert w is not None
+        assert 'nu' in w.lower()
 
     def test_rule6_lang_invalid_suffix(self, validator):
         """type 非 nu 但第 5 欄是 bitmap_font 數字"""
-        w = validator._rule6_lang_suffix('img', '5')
+        w = validator._rule6_lang_suffix('5')
         assert w is not None
         assert '多語系' in w or '數字' in w
 
     def test_rule6_lang_valid_suffix(self, validator):
         """type 非 nu 且第 5 欄是 language → 通過"""
-        assert validator._rule6_lang_suffix('img', 'cn') is None
+        assert validator._rule6_lang_suffix('cn') is None
 
     def test_rule6_no_suffix_passes(self, validator):
         """第 5 欄為空（empty_option）→ 通過"""
         empty = validator.d.empty_option
-        assert validator._rule6_lang_suffix('img', empty) is None
+        assert validator._rule6_lang_suffix(empty) is None
 
 
 # ── validate_all()：多條違規 ──────────────────────────────────────────────────
@@ -192,6 +251,21 @@ class TestValidateAll:
         warns = validator.validate_all('main_img_bg_na.png')
         assert warns == []
 
+    @pytest.mark.parametrize('filename', [
+        'lobby_nu_win_normal_0_x.png',      # NU：第 5 欄為合法數字
+        'lobby_img_bg_normal_en_x.png',     # 多國語系：第 5 欄為合法語系
+    ])
+    def test_six_fields_only_rule2(self, filename, validator):
+        """超過 5 欄：只回報底線，規則 5、6 只看第 5 欄本身，不誤報尾綴"""
+        assert validator.validate_all(filename) == [
+            '⚠️ 格式錯誤：各欄位內不得包含底線 [_] 符號',
+        ]
+
+    def test_six_fields_invalid_suffix_still_reported(self, validator):
+        """第 5 欄本身不合規時，規則 5 照常回報"""
+        warns = validator.validate_all('lobby_nu_win_normal_en_x.png')
+        assert '⚠️ [nu] 須符合數字規範，不得使用語系尾綴取名' in warns
+
     def test_layout_always_passes(self, validator):
         """layout 檔案跳過所有驗證"""
         warns = validator.validate_all('layout_basegame.png')
@@ -205,6 +279,63 @@ class TestValidateAll:
         assert single == all_w[0] if all_w else single is None
 
 
+# ── load_dict()：共用字典 ─────────────────────────────────────────────────────
+
+class TestLoadDict:
+
+    def test_same_path_returns_shared_loader(self):
+        """同一路徑只解析一次，回傳同一個 DictLoader"""
+        load_dict.cache_clear()
+        first = load_dict('config/game_dict.yaml')
+        assert load_dict('config/game_dict.yaml') is first
+        load_dict.cache_clear()
+        assert load_dict('config/game_dict.yaml') is not first
+
+
+# ── validate_many()：批次驗證 ────────────────────────────────────────────────
+
+class TestValidateMany:
+
+    def test_matches_validate(self, validator):
+        """批次結果與逐一 validate() 一致，重複檔名只出現一次"""
+        names = ['main_img_bg_na.png', 'main_img_bg.png', 'main_img_bg_na.png']
+        result = validator.validate_many(names)
+        assert list(result) == ['main_img_bg_na.png', 'main_img_bg.png']
+        for name, warn in result.items():
+            assert warn == validator.validate(name)
+
+
+# ── validate() 快取 ───────────────────────────────────────────────────────────
+
+class TestValidateCache:
+
+    def test_repeated_filename_hits_cache(self):
+        """同一檔名重複驗證 → 命中快取，結果一致"""
+        v = FilenameValidator(DictLoader('config/game_dict.yaml'))
+        first  = v.validate('main_img_bg.png')
+        second = v.validate('main_img_bg.png')
+        assert first == second
+        assert v._validate_cached.cache_info().hits == 1
+
+    def test_clear_cache(self):
+        """clear_cache() 後快取清空"""
+        v = FilenameValidator(DictLoader('config/game_dict.yaml'))
+        v.validate('main_img_bg_na.png')
+        v.validate_all('main_img_bg_na.png')
+        v.clear_cache()
+        assert v._validate_cached.cache_info().currsize == 0
+        assert v._validate_all_cached.cache_info().currsize == 0
+
+    def test_validate_all_returns_fresh_list(self):
+        """validate_all 命中快取時回傳新 list，修改回傳值不影響下次結果"""
+        v = FilenameValidator(DictLoader('config/game_dict.yaml'))
+        first = v.validate_all('main_img_bg.png')
+        first.append('extra')
+        second = v.validate_all('main_img_bg.png')
+        assert second == first[:-1]
+        assert v._validate_all_cached.cache_info().hits == 1
+
+
 # ── validate_group_key() ──────────────────────────────────────────────────────
 
 class TestValidateGroupKey:
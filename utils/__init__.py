@@ -4,8 +4,23 @@
 
 from .logger import SyncLogger, LogIcons
 from .retry import retry, async_retry
-from .config_loader import ConfigLoader
-from .note_loader import NoteLoader
+
+# ConfigLoader / NoteLoader 依賴 yaml、openpyxl，首次存取時才匯入（PEP 562）
+_LAZY_ATTRS = {
+    'ConfigLoader': '.config_loader',
+    'NoteLoader':   '.note_loader',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'SyncLogger',
@@ -5,9 +5,65 @@
 
 import os
 import re
-import yaml
+import functools
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# 環境變數參照：${VAR_NAME} 或 $VAR_NAME
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def _missing_env_error(names: List[str]) -> ValueError:
+    """一次列出所有未設定的環境變數，不必逐一修正後重試"""
+    names = list(dict.fromkeys(names))
+    exports = '; '.join(f"export {n}='your_value'" for n in names)
+    quoted = ', '.join(f"'{n}'" for n in names)
+    return ValueError(f"環境變數 {quoted} 未設定，請執行: {exports}")
+
+
+# 配置必要欄位（巢狀路徑）
+_REQUIRED_FIELDS: Tuple[Tuple[str, ...], ...] = (
+    ('project', 'name'),
+    ('project', 'type'),
+    ('confluence', 'url'),
+    ('confluence', 'page_id'),
+    ('confluence', 'email'),
+    ('confluence', 'api_token'),
+    ('confluence', 'user_account_id'),
+    ('sync', 'target_folder'),
+)
+
+
+def _has_path(obj: Any, path: Tuple[str, ...]) -> bool:
+    """巢狀 dict 中是否存在 path 指定的鍵（值為 null 也算存在）"""
+    for key in path:
+        if not isinstance(obj, dict) or key not in obj:
+            return False
+        obj = obj[key]
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """get_nested 的點分隔路徑 → 鍵序列（同一路徑只切一次）"""
+    return tuple(path.split('.'))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml(abspath: str, mtime_ns: int, size: int) -> Any:
+    """
+    解析 YAML 檔（以路徑 + 修改時間 + 大小為鍵快取，檔案變更後自動失效）。
+    回傳值為共用物件，不得修改（ConfigLoader.load 的回傳值與其共用子樹）。
+    """
+    # 以二進位開檔直接交給 loader：由 YAML reader 依 BOM 判斷編碼（預設 UTF-8），
+    # 省去先解碼成 str 再掃描的一輪
+    # yaml 延後到實際解析時才匯入，只用到 logger 等工具的程式不必載入
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)   # libyaml C 實作優先
+
+    with open(abspath, 'rb') as f:
+        return yaml.load(f, Loader=loader)
 
 
 class ConfigLoader:
@@ -22,22 +78,26 @@ class ConfigLoader:
             config_path: 配置文件路徑
         
         Returns:
-            配置字典
+            配置字典（與解析快取共用未含環境變數的子樹，請視為唯讀）
         
         Raises:
             FileNotFoundError: 配置文件不存在
             ValueError: 配置格式錯誤
         """
-        config_file = Path(config_path)
+        config_file = Path(config_path).resolve()
         
-        if not config_file.exists():
-            raise FileNotFoundError(f"配置文件不存在: {config_path}")
+        try:
+            st = config_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"配置文件不存在: {config_path}") from None
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _parse_yaml(str(config_file), st.st_mtime_ns, st.st_size)
         
-        # 替換環境變數
-        config = ConfigLoader._replace_env_vars(config)
+        # 替換環境變數（每次重新套用，環境變數變更不受快取影響）
+        missing: List[str] = []
+        config = ConfigLoader._replace_env_vars(config, missing)
+        if missing:
+            raise _missing_env_error(missing)
         
         # 驗證必要欄位
         ConfigLoader._validate_config(config)
@@ -45,30 +105,49 @@ class ConfigLoader:
         return config
     
     @staticmethod
-    def _replace_env_vars(obj: Any) -> Any:
+    def _replace_env_vars(obj: Any, missing: Optional[List[str]] = None) -> Any:
         """
         遞迴替換配置中的環境變數
         支援 ${VAR_NAME} 和 $VAR_NAME 格式
+
+        missing 有傳入時，未設定的變數名稱收集到其中（原字樣保留），由呼叫端
+        一次回報；未傳入時遇到第一個未設定的變數即拋出 ValueError
         """
+        # 沒有任何替換的子樹直接沿用原物件，只有路徑上真的改到的 dict / list 才複製
         if isinstance(obj, dict):
-            return {k: ConfigLoader._replace_env_vars(v) for k, v in obj.items()}
+            out = None
+            for k, v in obj.items():
+                nv = ConfigLoader._replace_env_vars(v, missing)
+                if nv is not v:
+                    if out is None:
+                        out = dict(obj)
+                    out[k] = nv
+            return obj if out is None else out
         elif isinstance(obj, list):
-            return [ConfigLoader._replace_env_vars(item) for item in obj]
+            out = None
+            for i, item in enumerate(obj):
+                nv = ConfigLoader._replace_env_vars(item, missing)
+                if nv is not item:
+                    if out is None:
+                        out = list(obj)
+                    out[i] = nv
+            return obj if out is None else out
         elif isinstance(obj, str):
-            # 匹配 ${VAR_NAME} 或 $VAR_NAME
-            pattern = r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
-            
-            def replacer(match):
+            # 絕大多數字串不含 '$'，直接略過正規表示式
+            if '$' not in obj:
+                return obj
+
+            def replacer(match: 're.Match[str]') -> str:
                 var_name = match.group(1) or match.group(2)
-                value = os.getenv(var_name)
+                value = os.environ.get(var_name)
                 if value is None:
-                    raise ValueError(
-                        f"環境變數 '{var_name}' 未設定，"
-                        f"請執行: export {var_name}='your_value'"
-                    )
+                    if missing is None:
+                        raise _missing_env_error([var_name])
+                    missing.append(var_name)
+                    return match.group(0)
                 return value
-            
-            return re.sub(pattern, replacer, obj)
+
+            return _ENV_VAR_RE.sub(replacer, obj)
         else:
             return obj
     
@@ -80,27 +159,12 @@ class ConfigLoader:
         Raises:
             ValueError: 配置驗證失敗
         """
-        required_fields = [
-            ('project', 'name'),
-            ('project', 'type'),
-            ('confluence', 'url'),
-            ('confluence', 'page_id'),
-            ('confluence', 'email'),
-            ('confluence', 'api_token'),
-            ('confluence', 'user_account_id'),
-            ('sync', 'target_folder'),
+        missing = [
+            '.'.join(path) for path in _REQUIRED_FIELDS
+            if not _has_path(config, path)
         ]
-        
-        for *path, field in required_fields:
-            obj = config
-            try:
-                for key in path:
-                    obj = obj[key]
-                if field not in obj:
-                    raise KeyError
-            except (KeyError, TypeError):
-                field_path = '.'.join(path + [field])
-                raise ValueError(f"配置缺少必要欄位: {field_path}")
+        if missing:
+            raise ValueError(f"配置缺少必要欄位: {', '.join(missing)}")
     
     @staticmethod
     def load_config_paths(
@@ -143,9 +207,12 @@ class ConfigLoader:
                 print("❌ 找不到配置，請使用 --configs 或 --config-list 指定")
                 sys.exit(1)
 
-        valid = [p for p in raw if Path(p).exists()]
-        for skipped in set(raw) - set(valid):
-            print(f"⚠️  跳過不存在的配置：{skipped}")
+        # 每個不同路徑只 stat 一次；警告依輸入順序列出
+        exists = {p: os.path.exists(p) for p in dict.fromkeys(raw)}
+        valid = [p for p in raw if exists[p]]
+        for skipped, ok in exists.items():
+            if not ok:
+                print(f"⚠️  跳過不存在的配置：{skipped}")
 
         if not valid:
             print("❌ 沒有有效的配置文件")
@@ -169,11 +236,10 @@ class ConfigLoader:
         Example:
             value = ConfigLoader.get_nested(config, 'sync.max_workers.download', 15)
         """
-        keys = path.split('.')
         obj = config
         
         try:
-            for key in keys:
+            for key in _split_path(path):
                 obj = obj[key]
             return obj
         except (KeyError, TypeError):
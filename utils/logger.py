@@ -5,8 +5,51 @@
 
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Tuple
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    時間格式只到秒：同一秒內的紀錄沿用上次格式化好的時間字串，
+    localtime + strftime 從每筆一次降為每秒一次
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._time_cache: Tuple[int, str] = (-1, '')   # (秒, 字串)，整組替換以保持執行緒安全
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        t = int(record.created)
+        cached_t, cached_s = self._time_cache
+        if t != cached_t:
+            cached_s = time.strftime(datefmt or self.datefmt, self.converter(t))
+            self._time_cache = (t, cached_s)
+        return cached_s
+
+
+# 跨 SyncLogger 共用的 handler（鍵為輸出目標）
+_HANDLER_CACHE: Dict[Tuple, logging.Handler] = {}
+
+
+def _console_handler() -> logging.Handler:
+    """
+    所有 SyncLogger 共用同一個終端 handler：
+    多專案並行時只有一把 stdout 鎖，各專案的輸出行不會互相穿插
+    """
+    key = ('console', sys.stdout)
+    handler = _HANDLER_CACHE.get(key)
+    if handler is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(_SecondCachedFormatter(
+            '[%(asctime)s] %(message)s',
+            datefmt='%H:%M:%S'
+        ))
+        _HANDLER_CACHE[key] = handler
+    return handler
 
 
 class SyncLogger:
@@ -25,21 +68,14 @@ class SyncLogger:
         log_path = Path(log_dir)
         log_path.mkdir(exist_ok=True)
         
-        # Console Handler（終端輸出）
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '[%(asctime)s] %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        # Console Handler（終端輸出，所有專案共用）
+        self.logger.addHandler(_console_handler())
         
         # File Handler（檔案輸出）
         log_file = log_path / f"{project_name}_{datetime.now():%Y%m%d}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
+        file_formatter = _SecondCachedFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
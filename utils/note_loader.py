@@ -12,8 +12,56 @@ xlsx 格式：
   - NU 群組   → key = 群組名，如 main_nu_win（不含序號與副檔名）
 """
 
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ── xlsx（OOXML）命名空間 ──────────────────────────────────────────────────
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL  = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG  = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+_ROW  = _NS_MAIN + 'row'
+_CELL = _NS_MAIN + 'c'
+_V    = _NS_MAIN + 'v'
+_T    = _NS_MAIN + 't'
+_R    = _NS_MAIN + 'r'
+_IS   = _NS_MAIN + 'is'
+_SI   = _NS_MAIN + 'si'
+
+# 直接解析失敗時改走 openpyxl 的例外（格式不符預期、缺檔、非 zip 等）
+_XML_FALLBACK_ERRORS = (
+    KeyError, IndexError, ValueError, AttributeError, ET.ParseError, zipfile.BadZipFile,
+)
+
+
+def _rich_text(elem: ET.Element) -> str:
+    """<si> / <is> 的文字：直屬 <t> 或 rich text 的 <r><t>，略過注音標示 <rPh>"""
+    parts = [t.text or '' for t in elem.iterfind(_T)]
+    parts.extend(t.text or '' for t in elem.iterfind(f'{_R}/{_T}'))
+    return ''.join(parts)
+
+
+def _cell_value(cell: ET.Element, sst: List[str]) -> Any:
+    """將 <c> 轉成與 openpyxl（data_only, values_only）相同的值"""
+    t = cell.get('t', 'n')
+    if t == 'inlineStr':
+        is_ = cell.find(_IS)
+        return _rich_text(is_) if is_ is not None else None
+
+    v = cell.findtext(_V)
+    if not v:
+        return None
+    if t == 's':
+        return sst[int(v)]
+    if t == 'n':
+        return float(v) if ('.' in v or 'E' in v or 'e' in v) else int(v)
+    if t == 'b':
+        return bool(int(v))
+    return v   # str（公式字串）、e（錯誤值）、d（ISO 日期）保留原字串
 
 
 class NoteLoader:
@@ -27,34 +75,34 @@ class NoteLoader:
         """
         self._notes: Dict[str, str] = {}
         self._file = Path(notes_file) if notes_file else None
+        # 上次成功載入時的 (st_mtime_ns, st_size)；未變更時 reload 不重新解析
+        self._stat: Optional[Tuple[int, int]] = None
         self._load()
 
     def reload(self) -> bool:
         """重新從磁碟讀取 xlsx（監聽模式下 xlsx 更新後呼叫）。
         
         Returns:
-            True = 有成功載入新資料；False = 檔案不存在或讀取失敗（舊資料保留不變）
+            True = 有成功載入新資料，或檔案自上次載入後未變更；
+            False = 檔案不存在或讀取失敗（舊資料保留不變）
         """
         old_count = len(self._notes)
-        new_notes: Dict[str, str] = {}
 
-        if not self._file or not self._file.exists():
+        if not self._file:
             return False
-
         try:
-            import openpyxl
-            wb = openpyxl.load_workbook(self._file, read_only=True, data_only=True)
-            ws = wb.active
-            for row in ws.iter_rows(min_row=1, values_only=True):
-                if not row or row[0] is None:
-                    continue
-                key = str(row[0]).strip()
-                note = str(row[1]).strip() if len(row) > 1 and row[1] is not None else ""
-                if key:
-                    new_notes[key] = note
-            wb.close()
+            st = self._file.stat()
+        except OSError:
+            return False
+
+        # 部分編輯器存檔時會多發沒有改內容的事件：修改時間與大小都相同就沿用現有資料
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._stat:
+            return True
 
-            self._notes = new_notes
+        try:
+            self._notes = self._read_notes()
+            self._stat = key
             print(f"[NoteLoader] 重新載入說明文件：{self._file}，共 {len(self._notes)} 筆（原 {old_count} 筆）")
             return True
 
@@ -69,24 +117,16 @@ class NoteLoader:
         """讀取 xlsx；失敗時靜默略過（不中斷同步流程）"""
         if not self._file:
             return
-        if not self._file.exists():
+        try:
+            st = self._file.stat()
+        except OSError:
             print(f"[NoteLoader] 說明文件不存在，略過：{self._file}")
             return
 
+        key = (st.st_mtime_ns, st.st_size)
         try:
-            import openpyxl
-            wb = openpyxl.load_workbook(self._file, read_only=True, data_only=True)
-            ws = wb.active
-
-            for row in ws.iter_rows(min_row=1, values_only=True):
-                if not row or row[0] is None:
-                    continue
-                key = str(row[0]).strip()
-                note = str(row[1]).strip() if len(row) > 1 and row[1] is not None else ""
-                if key:
-                    self._notes[key] = note
-
-            wb.close()
+            self._notes = self._read_notes()
+            self._stat = key
             print(f"[NoteLoader] 載入說明文件：{self._file}，共 {len(self._notes)} 筆")
 
         except ImportError:
@@ -94,6 +134,105 @@ class NoteLoader:
         except Exception as e:
             print(f"[NoteLoader] 讀取說明文件失敗：{e}。略過說明文件。")
 
+    def _read_notes(self) -> Dict[str, str]:
+        """
+        讀取 xlsx 的 A、B 兩欄為 {key: note}。
+
+        先直接解析 zip 內的 XML；格式不符預期時改用 openpyxl
+        （此時缺少 openpyxl 會拋出 ImportError）。
+        """
+        try:
+            rows = self._iter_rows_xml()
+        except _XML_FALLBACK_ERRORS:
+            rows = self._iter_rows_openpyxl()
+
+        notes: Dict[str, str] = {}
+        for key, note in rows:
+            if key is None:
+                continue
+            key = str(key).strip()
+            if key:
+                notes[key] = str(note).strip() if note is not None else ""
+        return notes
+
+    def _iter_rows_xml(self) -> List[Tuple[Any, Any]]:
+        """
+        直接以 zipfile + iterparse 串流讀取作用中工作表的 A、B 欄。
+
+        openpyxl 即使 read_only 也會建立整份活頁簿模型；說明表只需兩欄，
+        逐列解析並在每列結束後 clear()，時間與記憶體都省下大半。
+        儲存格的數值格式（如日期）不套用，依原始值回傳。
+        """
+        rows: List[Tuple[Any, Any]] = []
+        with zipfile.ZipFile(self._file) as z:
+            sheet_path = self._active_sheet_path(z)
+
+            sst: List[str] = []
+            if 'xl/sharedStrings.xml' in z.namelist():
+                with z.open('xl/sharedStrings.xml') as f:
+                    for _, elem in ET.iterparse(f):
+                        if elem.tag == _SI:
+                            sst.append(_rich_text(elem))
+                            elem.clear()
+
+            with z.open(sheet_path) as f:
+                for _, elem in ET.iterparse(f):
+                    if elem.tag != _ROW:
+                        continue
+                    a = b = None
+                    col = 0
+                    for cell in elem.iterfind(_CELL):
+                        ref = cell.get('r')
+                        if ref:
+                            # 欄名為開頭的字母：A1 → A、B12 → B、AA3 → AA
+                            letter = ref.rstrip('0123456789')
+                        else:
+                            col += 1
+                            letter = 'A' if col == 1 else 'B' if col == 2 else ''
+                        if letter == 'A':
+                            a = _cell_value(cell, sst)
+                        elif letter == 'B':
+                            b = _cell_value(cell, sst)
+                    rows.append((a, b))
+                    elem.clear()
+        return rows
+
+    @staticmethod
+    def _active_sheet_path(z: zipfile.ZipFile) -> str:
+        """由 workbook.xml 的 activeTab 與關聯檔找出作用中工作表（同 openpyxl 的 wb.active）"""
+        with z.open('xl/workbook.xml') as f:
+            wb = ET.parse(f).getroot()
+        if wb.tag != _NS_MAIN + 'workbook':
+            raise ValueError(f"不支援的 workbook 命名空間：{wb.tag}")
+
+        view = wb.find(f'{_NS_MAIN}bookViews/{_NS_MAIN}workbookView')
+        active = int(view.get('activeTab', 0)) if view is not None else 0
+        rid = wb.findall(f'{_NS_MAIN}sheets/{_NS_MAIN}sheet')[active].get(_NS_REL + 'id')
+
+        with z.open('xl/_rels/workbook.xml.rels') as f:
+            rels = ET.parse(f).getroot()
+        for rel in rels.iterfind(_NS_PKG + 'Relationship'):
+            if rel.get('Id') == rid:
+                target = rel.get('Target')
+                # Target 可為絕對路徑（/xl/...）或相對於 xl/
+                if target.startswith('/'):
+                    return target[1:]
+                return posixpath.normpath(posixpath.join('xl', target))
+        raise KeyError(rid)
+
+    def _iter_rows_openpyxl(self) -> List[Tuple[Any, Any]]:
+        """以 openpyxl 讀取 A、B 欄（直接解析失敗時的備援）"""
+        import openpyxl
+
+        wb = openpyxl.load_workbook(self._file, read_only=True, data_only=True)
+        try:
+            # 只取 A、B 兩欄：其餘欄位不建立 cell，每列固定為 (A, B)
+            return list(wb.active.iter_rows(
+                min_row=1, min_col=1, max_col=2, values_only=True
+            ))
+        finally:
+            wb.close()
+
     def get(self, key: str) -> str:
         """
         取得說明文字。
@@ -109,11 +248,13 @@ class NoteLoader:
         Returns:
             說明文字，找不到則回傳 ""
         """
-        if key in self._notes:
-            return self._notes[key]
+        note = self._notes.get(key)
+        if note is not None:
+            return note
 
-        # 嘗試去掉副檔名
-        stem = Path(key).stem
+        # 嘗試去掉副檔名（同 Path(key).stem，不建立 Path 物件）
+        i = key.rfind('.')
+        stem = key[:i] if 0 < i < len(key) - 1 else key
         return self._notes.get(stem, "")
 
     def as_dict(self) -> Dict[str, str]:
@@ -5,7 +5,7 @@
 
 import time
 from functools import wraps
-from typing import Callable, Type, Tuple
+from typing import Any, Callable, Type, Tuple
 
 
 def retry(
@@ -32,43 +32,62 @@ def retry(
             # 失敗時會自動重試 3 次
             pass
     """
+    delays = _backoff_delays(max_attempts, delay, backoff)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempt = 0
-            current_delay = delay
-            last_exception = None
-            
-            while attempt < max_attempts:
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    attempt += 1
-                    
-                    if attempt >= max_attempts:
-                        raise
-                    
-                    # 記錄重試資訊（如果有 logger 參數）
-                    if 'logger' in kwargs:
-                        logger = kwargs['logger']
-                        logger.warning(
-                            "⏳",
-                            f"操作失敗，{current_delay:.1f}秒後重試 "
-                            f"({attempt}/{max_attempts}): {str(e)}"
-                        )
-                    
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-            
-            # 不應該到這裡，但為了安全起見
-            if last_exception:
-                raise last_exception
+            # 成功路徑只有一次呼叫；重試相關狀態等第一次失敗才建立
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                if not delays:
+                    raise
+                error = e
+            # 離開 except 區塊後才重試：等待不在例外處理中進行，
+            # 之後的例外也不會把第一次失敗串成 __context__
+            return _retry_slow(func, args, kwargs, error, delays, exceptions)
             
         return wrapper
     return decorator
 
 
+def _backoff_delays(max_attempts: int, delay: float, backoff: float) -> Tuple[float, ...]:
+    """第 1..max_attempts-1 次失敗後的等待秒數，裝飾時算好一次"""
+    return tuple(delay * backoff ** i for i in range(max_attempts - 1))
+
+
+def _retry_slow(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    first_error: Exception,
+    delays: Tuple[float, ...],
+    exceptions: Tuple[Type[Exception], ...],
+) -> Any:
+    """retry 第一次失敗後的重試迴圈（第 1 次嘗試已由 wrapper 執行）"""
+    logger = kwargs.get('logger')   # 記錄重試資訊（如果有 logger 參數）
+    max_attempts = len(delays) + 1
+    error = first_error
+    
+    for attempt, current_delay in enumerate(delays, 1):
+        if logger is not None:
+            logger.warning(
+                "⏳",
+                f"操作失敗，{current_delay:.1f}秒後重試 "
+                f"({attempt}/{max_attempts}): {str(error)}"
+            )
+        
+        time.sleep(current_delay)
+        
+        try:
+            return func(*args, **kwargs)
+        except exceptions as e:
+            if attempt == len(delays):
+                raise
+            error = e
+
+
 def async_retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -87,29 +106,40 @@ def async_retry(
     Returns:
         裝飾後的非同步函數
     """
+    delays = _backoff_delays(max_attempts, delay, backoff)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            import asyncio
-            attempt = 0
-            current_delay = delay
-            last_exception = None
-            
-            while attempt < max_attempts:
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    attempt += 1
-                    
-                    if attempt >= max_attempts:
-                        raise
-                    
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff
-            
-            if last_exception:
-                raise last_exception
+            try:
+                return await func(*args, **kwargs)
+            except exceptions:
+                if not delays:
+                    raise
+            # 同 retry：離開 except 區塊後才重試
+            return await _async_retry_slow(func, args, kwargs, delays, exceptions)
             
         return wrapper
     return decorator
+
+
+async def _async_retry_slow(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    delays: Tuple[float, ...],
+    exceptions: Tuple[Type[Exception], ...],
+) -> Any:
+    """async_retry 第一次失敗後的重試迴圈（第 1 次嘗試已由 wrapper 執行）"""
+    # asyncio 匯入約 40ms 且目前無其他模組使用：只在真的要重試時才載入，
+    # 不放模組頂層，避免每個行程啟動都付這筆成本
+    import asyncio
+    
+    for attempt, current_delay in enumerate(delays, 1):
+        await asyncio.sleep(current_delay)
+        
+        try:
+            return await func(*args, **kwargs)
+        except exceptions:
+            if attempt == len(delays):
+                raise